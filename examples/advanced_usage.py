@@ -1,12 +1,18 @@
 """Advanced usage examples for SimpleDSPy"""
 
-import dspy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional, Dict
+
+import dspy
 from simpledspy import predict, chain_of_thought, configure
 
 # Configure language model
 configure(lm=dspy.LM(model="openai/gpt-3.5-turbo"), temperature=0.7, max_tokens=200)
 
+# Upper bound on concurrent LM requests, to stay within provider rate limits
+MAX_CONCURRENT_REQUESTS = 10
+
 
 def type_hints_advanced():
     """Advanced type hints for complex scenarios"""
@@ -39,7 +45,9 @@ def context_preservation():
     """Example: Preserving context across calls"""
     print("=== Context Preservation ===")
 
-    # SimpleDSPy can maintain context through variable names
+    # SimpleDSPy can maintain context through variable names. The shared
+    # context is passed first in every call, so providers with prompt caching
+    # can reuse the prefix (see "Prompt caching" in the README)
     context = "We are discussing artificial intelligence and its impact on society."
 
     # First question
@@ -163,8 +171,11 @@ def error_handling_and_validation():
         ("Short", "expand into paragraph"),
     ]
 
-    for text, task in test_cases:
-        result = safe_predict(text, task)
+    # The calls are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        results = list(executor.map(lambda case: safe_predict(*case), test_cases))
+
+    for (text, task), result in zip(test_cases, results):
         print(f"Input: '{text}' | Task: '{task}'")
         print(f"Result: {result}")
         print()
@@ -182,21 +193,22 @@ def batch_processing():
         "Great job on the presentation! Very impressed.",
     ]
 
-    # Process in batch
-    results = []
-    for email in emails:
+    def analyze_email(email: str) -> Dict:
         sentiment, priority = predict(
             email,
             outputs=["sentiment", "priority"],
             description="Analyze email sentiment and assign priority (high/medium/low)",
         )
-        results.append(
-            {
-                "email": email[:50] + "...",  # Truncate for display
-                "sentiment": sentiment,
-                "priority": priority,
-            }
-        )
+        return {
+            "email": email[:50] + "...",  # Truncate for display
+            "sentiment": sentiment,
+            "priority": priority,
+        }
+
+    # Process in batch: the LM calls run concurrently, so the total latency
+    # is close to that of the slowest request instead of the sum of all
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        results = list(executor.map(analyze_email, emails))
 
     # Display results
     print("Email Batch Analysis:")
@@ -210,40 +222,36 @@ def dynamic_output_handling():
     """Example: Dynamic output based on input"""
     print("=== Dynamic Output Handling ===")
 
+    # Fields produced for each analysis type
+    analysis_fields = {
+        "sentiment": ["sentiment", "confidence"],
+        "summary": ["summary", "key_points"],
+        "full": ["sentiment", "summary", "key_points", "recommendation"],
+    }
+    all_fields = ["sentiment", "confidence", "summary", "key_points", "recommendation"]
+
+    @lru_cache(maxsize=32)
+    def analyze_all(content: str) -> Dict:
+        """Produce every analysis field in a single LM call per content"""
+        values = predict(
+            content,
+            inputs=["content"],
+            outputs=all_fields,
+            description="Comprehensive analysis with sentiment, confidence score, "
+            "summary, key points and recommendation",
+        )
+        return dict(zip(all_fields, values))
+
     def analyze_content(content: str, analysis_type: str) -> Dict:
         """Dynamically determine outputs based on analysis type"""
-
-        if analysis_type == "sentiment":
-            sentiment, confidence = predict(
-                content,
-                outputs=["sentiment", "confidence"],
-                description="Analyze sentiment with confidence score",
-            )
-            return {"sentiment": sentiment, "confidence": confidence}
-
-        elif analysis_type == "summary":
-            summary, key_points = predict(
-                content,
-                outputs=["summary", "key_points"],
-                description="Create summary and extract key points",
-            )
-            return {"summary": summary, "key_points": key_points}
-
-        elif analysis_type == "full":
-            sentiment, summary, key_points, recommendation = predict(
-                content,
-                outputs=["sentiment", "summary", "key_points", "recommendation"],
-                description="Comprehensive analysis with all aspects",
-            )
-            return {
-                "sentiment": sentiment,
-                "summary": summary,
-                "key_points": key_points,
-                "recommendation": recommendation,
-            }
-        else:
+        fields = analysis_fields.get(analysis_type)
+        if fields is None:
             return {"error": "Unknown analysis type"}
 
+        # Repeated analyses of the same content reuse the fused result
+        analysis = analyze_all(content)
+        return {field: analysis[field] for field in fields}
+
     # Example content
     content = """
     The new product launch was highly successful, exceeding our initial projections 
@@ -251,7 +259,7 @@ def dynamic_output_handling():
     praise for the innovative features and user-friendly design.
     """
 
-    # Different analysis types
+    # Different analysis types; only the first one calls the LM
     for analysis_type in ["sentiment", "summary", "full"]:
         print(f"\nAnalysis Type: {analysis_type}")
         result = analyze_content(content, analysis_type)
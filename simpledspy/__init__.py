@@ -8,13 +8,11 @@ Provides:
 - configure: Function to set global settings
 """
 
+import importlib as _importlib
 import sys as _sys
 
-# Import our own modules
-from .module_caller import Predict, ChainOfThought
-from .pipeline_manager import PipelineManager
-from .module_factory import ModuleFactory
-from .optimization_manager import OptimizationManager
+# Lightweight modules are imported eagerly; everything that pulls in dspy is
+# loaded on first attribute access (PEP 562), so `import simpledspy` stays fast
 from .settings import settings as global_settings
 from .exceptions import (
     SimpleDSPyError,
@@ -25,9 +23,35 @@ from .exceptions import (
     SecurityError
 )
 
-# Create the function instances
-predict = Predict()
-chain_of_thought = ChainOfThought()
+# Lazily loaded attributes: name -> (submodule, attribute)
+_LAZY_ATTRIBUTES = {
+    "predict": ("module_caller", "Predict"),
+    "chain_of_thought": ("module_caller", "ChainOfThought"),
+    "Predict": ("module_caller", "Predict"),
+    "ChainOfThought": ("module_caller", "ChainOfThought"),
+    "PipelineManager": ("pipeline_manager", "PipelineManager"),
+    "ModuleFactory": ("module_factory", "ModuleFactory"),
+    "OptimizationManager": ("optimization_manager", "OptimizationManager"),
+}
+
+# Attributes that are caller instances rather than the classes themselves
+_CALLER_INSTANCES = frozenset(("predict", "chain_of_thought"))
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(_importlib.import_module(f".{module_name}", __name__), attribute)
+    if name in _CALLER_INSTANCES:
+        value = value()
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 # Check if the module is being imported incorrectly
 if not _sys.modules["simpledspy"].__name__.startswith("simpledspy"):
@@ -40,6 +64,10 @@ if not _sys.modules["simpledspy"].__name__.startswith("simpledspy"):
     )
 
 
+# Settings that determine which LM the module callers use
+_LM_SETTINGS = frozenset(("lm", "default_lm", "api_base", "cache"))
+
+
 def configure(**kwargs):
     """Set global configuration settings for SimpleDSPy.
 
@@ -48,6 +76,11 @@ def configure(**kwargs):
     """
     for key, value in kwargs.items():
         setattr(global_settings, key, value)
+    # Existing callers already hold an LM; rebuild it from the new settings
+    if _LM_SETTINGS.intersection(kwargs):
+        module_caller = _sys.modules.get(f"{__name__}.module_caller")
+        if module_caller is not None:
+            module_caller.BaseCaller.refresh_lm()
 
 
 # Package version
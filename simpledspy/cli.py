@@ -3,6 +3,7 @@
 
 Features:
 - Run DSPy modules and pipelines
+- Process many inputs concurrently from a JSONL batch file
 - Enable optimization with different strategies
 - Evaluate outputs with custom instructions
 - Generate training data from logs
@@ -12,16 +13,55 @@ See documentation for configuration instructions.
 """
 import sys
 import argparse
+import importlib
+import itertools
 import json
-from .module_factory import ModuleFactory
-from .evaluator import Evaluator
-from .optimization_manager import OptimizationManager
-from .pipeline_manager import PipelineManager
+from concurrent.futures import ThreadPoolExecutor
 
+try:  # Optional: faster serialization for --json
+    import orjson
+except ImportError:
+    orjson = None
 
-def _run_pipeline(args, factory, input_names, input_dict):
-    """Run a pipeline of modules."""
-    manager = PipelineManager()
+# Modules that import dspy are loaded only once arguments have been parsed, so
+# --help and usage errors return immediately: name -> submodule
+_LAZY_ATTRIBUTES = {
+    "ModuleFactory": "module_factory",
+    "PipelineManager": "pipeline_manager",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __package__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def _load(name):
+    """Look up a lazily imported class through the module, loading it if needed"""
+    return getattr(sys.modules[__name__], name)
+
+
+def _dumps(obj):
+    """Serialize one JSON output line, using orjson when it is installed.
+
+    orjson writes compact JSON with non-ASCII characters unescaped; the parsed
+    values are the same as with json.dumps, which handles what orjson rejects.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:  # orjson.JSONEncodeError: non-str keys, big integers
+            pass
+    return json.dumps(obj)
+
+
+def _build_pipeline(args, factory, input_names):
+    """Build a pipeline of modules."""
+    manager = _load("PipelineManager")()
     manager.reset()
 
     for i, desc in enumerate(args.pipeline):
@@ -36,21 +76,103 @@ def _run_pipeline(args, factory, input_names, input_dict):
             inputs=step_inputs, outputs=step_outputs, module=step_module
         )
 
-    pipeline = manager.assemble_pipeline()
+    return manager.assemble_pipeline()
+
+
+def _select_outputs(result, output_names):
+    """Pick the named outputs from a module or pipeline result."""
+    # A Prediction's fields are copied once rather than looked up one by one
+    # through its __getattr__; other results fall back to attribute access
+    to_dict = getattr(result, "toDict", None)
+    store = to_dict() if callable(to_dict) else None
+    if isinstance(store, dict):
+        return {name: store[name] for name in output_names}
+    return {name: getattr(result, name) for name in output_names}
+
+
+def _run_built_pipeline(pipeline, num_steps, input_dict):
+    """Run an assembled pipeline and return its final output."""
     result = pipeline(**input_dict)
-    output_name = f"output_{len(args.pipeline)}"
-    output_value = getattr(result, output_name)
-    return {output_name: output_value}
+    return _select_outputs(result, [f"output_{num_steps}"])
+
+
+def _run_pipeline(args, factory, input_names, input_dict):
+    """Run a pipeline of modules."""
+    pipeline = _build_pipeline(args, factory, input_names)
+    return _run_built_pipeline(pipeline, len(args.pipeline), input_dict)
 
 
 def _run_single_module(module, input_dict, output_names):
     """Run a single module."""
     result = module(**input_dict)
-    return {name: getattr(result, name) for name in output_names}
+    return _select_outputs(result, output_names)
 
 
-def main():  # pylint: disable=too-many-branches,too-many-statements
-    """Main function for the CLI."""
+def _parse_batch_lines(lines):
+    """Parse JSONL batch lines into rows of inputs."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        row = json.loads(line)
+        yield row if isinstance(row, list) else [row]
+
+
+def _iter_batch_rows(path):
+    """Yield batch rows from a JSONL file, or from stdin when path is "-".
+
+    Each line holds either a JSON array with the inputs of one row or a
+    single JSON value used as its only input. Lines are read lazily, so
+    input of any size is processed with bounded memory.
+    """
+    if path == "-":
+        yield from _parse_batch_lines(sys.stdin)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        yield from _parse_batch_lines(f)
+
+
+def _read_batch_chunk(row_iter, size, num_inputs=None):
+    """Read the next chunk of batch rows, exiting on invalid input."""
+    try:
+        chunk = list(itertools.islice(row_iter, size))
+    except (OSError, ValueError) as e:
+        print(f"Error loading batch file: {e}")
+        sys.exit(1)
+    if chunk and num_inputs is None:
+        num_inputs = len(chunk[0])
+    if any(len(row) != num_inputs for row in chunk):
+        print("Error: all batch rows must have the same number of inputs")
+        sys.exit(1)
+    return chunk
+
+
+def _emit_results(args, evaluator, input_dicts, outputs):
+    """Print the outputs of a group of runs and log their evaluation."""
+    # One write per group instead of one print (and lock round-trip) per line
+    if args.json:
+        lines = [_dumps(output_data) for output_data in outputs]
+    else:
+        lines = [
+            str(value) for output_data in outputs for value in output_data.values()
+        ]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+    if evaluator is not None:
+        for input_dict, output_data in zip(input_dicts, outputs):
+            evaluator.log_with_evaluation(
+                module=args.module,
+                inputs=input_dict,
+                outputs=output_data,
+                description=args.description,
+            )
+        evaluator.flush()
+
+
+def _build_parser():
+    """Build the argument parser for the CLI."""
     parser = argparse.ArgumentParser(description="SimpleDSPy command line interface")
     parser.add_argument(
         "inputs", nargs="*", help="Input strings to process (use - for stdin)"
@@ -91,25 +213,73 @@ def main():  # pylint: disable=too-many-branches,too-many-statements
     parser.add_argument(
         "--log-file", type=str, default="dspy_logs.jsonl", help="File to store logs"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--batch-file",
+        type=str,
+        help="JSONL file (- for stdin) with one row of inputs per line, "
+        "processed concurrently",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=64,
+        help="Rows read and processed per chunk in batch mode",
+    )
+    parser.add_argument(
+        "--num-threads",
+        type=int,
+        default=8,
+        help="Maximum concurrent requests in batch mode and optimization",
+    )
+    return parser
+
 
-    if args.inputs:
-        inputs = args.inputs
-    elif not sys.stdin.isatty():
-        inputs = sys.stdin.read().strip().split("\n")
+# Built once at import; parse_args does not modify the parser
+_PARSER = _build_parser()
+
+
+def main():  # pylint: disable=too-many-branches,too-many-statements
+    """Main function for the CLI."""
+    args = _PARSER.parse_args()
+
+    if args.batch_file:
+        row_iter = _iter_batch_rows(args.batch_file)
+        batch_size = max(1, args.batch_size)
+        rows = _read_batch_chunk(row_iter, batch_size)
+        inputs = rows[0] if rows else []
     else:
-        inputs = []
+        if args.inputs:
+            inputs = args.inputs
+        elif not sys.stdin.isatty():
+            inputs = sys.stdin.read().strip().split("\n")
+        else:
+            inputs = []
+        rows = [inputs]
 
-    factory = ModuleFactory()
+    factory = _load("ModuleFactory")()
     input_names = [f"input_{i+1}" for i in range(len(inputs))]
     output_names = ["output"]
-    module = factory.create_module(
-        inputs=input_names, outputs=output_names, description=args.description
-    )
+    # Built once and shared by the optimizer fallback and the first run
+    input_dicts = [dict(zip(input_names, row)) for row in rows]
+    # Pipeline runs use their own step modules; the single module is only
+    # needed there when it is optimized
+    module = None
+    if not args.pipeline or args.optimize:
+        module = factory.create_module(
+            inputs=input_names, outputs=output_names, description=args.description
+        )
 
     if args.optimize:
+        from .optimization_manager import (  # pylint: disable=import-outside-toplevel
+            OptimizationManager,
+        )
+
         manager = OptimizationManager()
-        manager.configure(strategy=args.strategy, max_bootstrapped_demos=args.max_demos)
+        manager.configure(
+            strategy=args.strategy,
+            max_bootstrapped_demos=args.max_demos,
+            num_threads=max(1, args.num_threads),
+        )
         trainset = []
         if args.trainset:
             try:
@@ -119,33 +289,49 @@ def main():  # pylint: disable=too-many-branches,too-many-statements
                 print(f"Error loading trainset: {e}")
                 sys.exit(1)
         else:
-            print("Warning: Using single input as trainset for optimization.")
-            trainset = [dict(zip(input_names, inputs))]
+            print("Warning: Using inputs as trainset for optimization.")
+            trainset = input_dicts
         module = manager.optimize(module, trainset)
 
-    input_dict = dict(zip(input_names, inputs))
-    if args.pipeline:
-        output_data = _run_pipeline(args, factory, input_names, input_dict)
-    else:
-        output_data = _run_single_module(module, input_dict, output_names)
-
-    if args.json:
-        print(json.dumps(output_data))
-    else:
-        for value in output_data.values():
-            print(str(value))
-
+    evaluator = None
     if args.evaluation_instruction:
+        from .evaluator import Evaluator  # pylint: disable=import-outside-toplevel
+
+        # Batch runs write the evaluation logs of a chunk together
         evaluator = Evaluator(
             evaluation_instruction=args.evaluation_instruction,
             log_file=args.log_file,
+            log_batch_size=batch_size if args.batch_file else 1,
         )
-        evaluator.log_with_evaluation(
-            module=args.module,
-            inputs=input_dict,
-            outputs=output_data,
-            description=args.description,
-        )
+
+    if args.batch_file:
+        if args.pipeline:
+            pipeline = _build_pipeline(args, factory, input_names)
+            num_steps = len(args.pipeline)
+
+            def run_row(input_dict):
+                return _run_built_pipeline(pipeline, num_steps, input_dict)
+
+        else:
+
+            def run_row(input_dict):
+                return _run_single_module(module, input_dict, output_names)
+
+        # Rows are independent, so their LM calls run concurrently; results
+        # are printed chunk by chunk in input order
+        with ThreadPoolExecutor(max_workers=max(1, args.num_threads)) as executor:
+            while input_dicts:
+                outputs = list(executor.map(run_row, input_dicts))
+                _emit_results(args, evaluator, input_dicts, outputs)
+                rows = _read_batch_chunk(row_iter, batch_size, len(input_names))
+                input_dicts = [dict(zip(input_names, row)) for row in rows]
+    else:
+        input_dict = input_dicts[0]
+        if args.pipeline:
+            output_data = _run_pipeline(args, factory, input_names, input_dict)
+        else:
+            output_data = _run_single_module(module, input_dict, output_names)
+        _emit_results(args, evaluator, [input_dict], [output_data])
 
 
 if __name__ == "__main__":
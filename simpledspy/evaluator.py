@@ -5,13 +5,91 @@ Features:
 - Logs inputs/outputs with scores
 """
 
+import itertools
+import json
 import re
+import threading
 import time
-from typing import Dict, List
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import dspy
 from .logger import Logger
+from .retry import RetryConfig, with_retry
 from .settings import settings as global_settings
 
+# Upper bound on remembered prompt scores per evaluator
+MAX_CACHED_SCORES = 4096
+
+# Sentinel for prompts that have not been scored yet
+_MISSING = object()
+
+# Score formats in the evaluator's response, tried in order:
+# "score: 8" or "rating: 8", "8/10" or "8 out of 10", then any standalone
+# number that is not the denominator of such a fraction
+_SCORE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:score|rating)[:\s]*(\d+(?:\.\d+)?)",
+        r"(\d+(?:\.\d+)?)\s*(?:/|out\s+of)\s*10",
+        r"(?<!/)(?<!/ )(?<!out of )\b(\d+(?:\.\d+)?)\b",
+    )
+)
+
+
+def _extract_score(response: str) -> Optional[Union[int, float]]:
+    """Return the last score between 1 and 10 found in a response
+
+    Reasoning models explain themselves before answering, so the final
+    number of the preferred format is taken as the score.
+    """
+    for pattern in _SCORE_PATTERNS:
+        score = None
+        for match in pattern.finditer(response):
+            text = match.group(1)
+            # Scores are usually whole numbers, which int() parses directly
+            value = float(text) if "." in text else int(text)
+            if 1 <= value <= 10:
+                score = value
+        if score is not None:
+            return score
+    return None
+
+
+def _format_for_prompt(obj) -> str:
+    """Render inputs or outputs as compact, deterministic prompt text"""
+    return json.dumps(obj, default=str, ensure_ascii=False)
+
+
+def _build_prompts(inputs: Dict, outputs: Dict, instructions: List[str]) -> List[str]:
+    """One evaluation prompt per instruction for the given inputs and outputs"""
+    # The inputs and outputs are formatted once and shared by all prompts
+    io_suffix = (
+        f"\n\nInputs: {_format_for_prompt(inputs)}"
+        f"\nOutputs: {_format_for_prompt(outputs)}"
+    )
+    return [f"{instruction}{io_suffix}" for instruction in instructions]
+
+
+def _average(scores: Sequence[Optional[float]]) -> float:
+    """Mean of the scores that were found, 0.0 if there are none"""
+    total = 0.0
+    count = 0
+    for score in scores:
+        if score is not None:
+            total += score
+            count += 1
+    return total / count if count else 0.0
+
+
+def _write_pending(logger: Logger, pending: List[Dict], lock: threading.Lock) -> None:
+    """Write and clear the buffered evaluation logs of an Evaluator"""
+    with lock:
+        records = pending[:]
+        pending.clear()
+    if records:
+        logger.log_many(records)
+
 
 class Evaluator:
     """Evaluates DSPy module outputs
@@ -19,72 +97,158 @@ class Evaluator:
     Attributes:
         evaluation_instruction: Instruction for evaluation
         logger: Logger instance for recording evaluations
-        evaluator_lm: Language model for evaluation
+        evaluator_lm: Language model for evaluation, created on first use
+        log_batch_size: Number of evaluations buffered before they are written
+        max_workers: Maximum concurrent LM calls per evaluate() (None uses
+            settings.num_threads, 1 scores instructions one after another)
     """
 
     def __init__(
-        self, evaluation_instruction: str = "", log_file: str = "dspy_logs.jsonl"
+        self,
+        evaluation_instruction: str = "",
+        log_file: str = "dspy_logs.jsonl",
+        log_batch_size: int = 1,
+        max_workers: Optional[int] = None,
     ):
         self.evaluation_instruction = evaluation_instruction
+        self.log_batch_size = max(1, log_batch_size)
+        self.max_workers = max_workers
+        self._pending_logs = []
+        self._pending_lock = threading.Lock()
         self.logger = Logger(log_file)
+        if self.log_batch_size > 1:
+            # Write out anything still buffered when the evaluator is garbage
+            # collected or the interpreter exits
+            self._finalizer = weakref.finalize(
+                self,
+                _write_pending,
+                self.logger,
+                self._pending_logs,
+                self._pending_lock,
+            )
+        self._score_cache = {}
+        self._cache_lock = threading.Lock()
+        # Transient LM errors (rate limits, timeouts) are retried with backoff
+        self.retry_config = RetryConfig(
+            max_attempts=global_settings.retry_attempts,
+            initial_delay=global_settings.retry_delay,
+        )
+        # The evaluator LM is built on first use, so evaluators that only log
+        # never construct or configure an LM
+        self._evaluator_lm = None
+        self._lm_lock = threading.Lock()
+
+    @property
+    def evaluator_lm(self):
+        """Language model for evaluation, created on first access"""
+        if self._evaluator_lm is None:
+            with self._lm_lock:
+                if self._evaluator_lm is None:
+                    self._evaluator_lm = self._create_evaluator_lm()
+        return self._evaluator_lm
+
+    @staticmethod
+    def _create_evaluator_lm():
+        """Create and configure the evaluator LM described by the settings"""
         # Use evaluator LM from settings if available, otherwise use default
         if global_settings.evaluator_lm:
-            self.evaluator_lm = dspy.LM(model=global_settings.evaluator_lm)
+            lm = dspy.LM(
+                model=global_settings.evaluator_lm, **global_settings.lm_kwargs()
+            )
         elif global_settings.lm:
-            self.evaluator_lm = global_settings.lm
+            lm = global_settings.lm
         else:
-            self.evaluator_lm = dspy.LM(model="openai/gpt-3.5-turbo")
-        dspy.configure(lm=self.evaluator_lm)
+            lm = dspy.LM(model="openai/gpt-3.5-turbo", **global_settings.lm_kwargs())
+        # Skip reconfiguring when this LM is already the configured one
+        if dspy.settings.lm is not lm:
+            dspy.configure(lm=lm)
+        return lm
+
+    @property
+    def is_enabled(self) -> bool:
+        """Whether outputs are scored without per-call instructions"""
+        return bool(self.evaluation_instruction)
+
+    def _score_prompt(self, prompt: str, lm) -> Optional[float]:
+        """Score outputs with a single evaluation prompt"""
+        # Identical prompts (e.g. re-scored during optimization) reuse the
+        # score. The key is the exact prompt: outputs that differ only in
+        # whitespace may deserve different scores.
+        if global_settings.cache:
+            cached = self._score_cache.get(prompt, _MISSING)
+            if cached is not _MISSING:
+                return cached
+
+        completions = with_retry(self.retry_config)(lm)(prompt)
+        if not completions:
+            return None
+
+        # Take the first completion
+        score = _extract_score(completions[0])
+        if global_settings.cache:
+            with self._cache_lock:
+                if len(self._score_cache) >= MAX_CACHED_SCORES:
+                    self._score_cache.pop(next(iter(self._score_cache)))
+                self._score_cache[prompt] = score
+        return score
+
+    def _score_prompts(self, prompts: List[str]) -> List[Optional[float]]:
+        """Score prompts concurrently with at most max_workers LM calls at once"""
+        if not prompts:
+            return []
+        # The LM is created, and configured in dspy, in the calling thread;
+        # dspy settings must not be configured from the worker threads
+        lm = self.evaluator_lm
+        max_workers = min(len(prompts), self.max_workers or global_settings.num_threads)
+        if max_workers <= 1:
+            return [self._score_prompt(prompt, lm) for prompt in prompts]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._score_prompt, prompts, itertools.repeat(lm)))
+
+    def _instructions(self, evaluation_instructions: List[str] = None) -> List[str]:
+        """Instructions to score with, the instance instruction by default"""
+        if evaluation_instructions:
+            return list(evaluation_instructions)
+        return [self.evaluation_instruction] if self.is_enabled else []
 
     def evaluate(
         self, inputs: Dict, outputs: Dict, evaluation_instructions: List[str] = None
     ) -> float:
         """Evaluate outputs on a scale of 1-10 using multiple instructions"""
-        if evaluation_instructions is None:
-            evaluation_instructions = []
-
-        if not evaluation_instructions and not self.evaluation_instruction:
+        instructions = self._instructions(evaluation_instructions)
+        if not instructions:
             return 0.0  # No evaluation without instructions
 
-        # Use instance instruction if no specific instructions provided
-        if not evaluation_instructions:
-            evaluation_instructions = [self.evaluation_instruction]
-
-        scores = []
-        for instruction in evaluation_instructions:
-            # Construct evaluation prompt
-            prompt = f"{instruction}\n\nInputs: {inputs}\nOutputs: {outputs}"
-            completions = self.evaluator_lm(prompt)
-            if not completions:
-                continue
-
-            # Take the first completion
-            response = completions[0]
-
-            # Extract scores from response with improved pattern
-            # Look for patterns like "score: 8", "8/10", "rating: 8", or just "8"
-            score_patterns = [
-                r"(?:score|rating)[:\s]*(\d+(?:\.\d+)?)",  # score: 8 or rating: 8
-                r"(\d+(?:\.\d+)?)\s*/\s*10",  # 8/10 format
-                r"\b(\d+(?:\.\d+)?)\b",  # standalone number
-            ]
-
-            score_found = False
-            for pattern in score_patterns:
-                if score_found:
-                    break
-                matches = re.findall(pattern, response, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        score = float(match)
-                        if 1 <= score <= 10:
-                            scores.append(score)
-                            score_found = True
-                            break  # take first valid score
-                    except ValueError:
-                        continue
-
-        return sum(scores) / len(scores) if scores else 0.0
+        # Instructions are scored independently, so their LM calls overlap
+        prompts = _build_prompts(inputs, outputs, instructions)
+        return _average(self._score_prompts(prompts))
+
+    def evaluate_batch(
+        self,
+        pairs: Sequence[Tuple[Dict, Dict]],
+        evaluation_instructions: List[str] = None,
+    ) -> List[float]:
+        """Evaluate several (inputs, outputs) pairs concurrently
+
+        Returns one score per pair, in the order of the pairs.
+        """
+        instructions = self._instructions(evaluation_instructions)
+        if not instructions:
+            return [0.0] * len(pairs)
+
+        # Every (pair, instruction) prompt goes through one pool, so max_workers
+        # bounds the LM calls of the whole batch
+        prompts = [
+            prompt
+            for inputs, outputs in pairs
+            for prompt in _build_prompts(inputs, outputs, instructions)
+        ]
+        scores = self._score_prompts(prompts)
+        per_pair = len(instructions)
+        return [
+            _average(scores[start : start + per_pair])
+            for start in range(0, len(scores), per_pair)
+        ]
 
     def log_with_evaluation(  # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
@@ -95,7 +259,11 @@ class Evaluator:
         evaluation_instructions: List[str] = None,
     ):
         """Log inputs/outputs with evaluation score"""
-        score = self.evaluate(inputs, outputs, evaluation_instructions)
+        # Without any instruction there is nothing to score, only to log
+        if evaluation_instructions or self.is_enabled:
+            score = self.evaluate(inputs, outputs, evaluation_instructions)
+        else:
+            score = 0.0
 
         # Store individual instructions if provided
         if evaluation_instructions:
@@ -118,4 +286,16 @@ class Evaluator:
             "score": score,
             "timestamp": timestamp,
         }
-        self.logger.log(log_data)
+        if self.log_batch_size == 1:
+            self.logger.log(log_data)
+            return
+
+        with self._pending_lock:
+            self._pending_logs.append(log_data)
+            full = len(self._pending_logs) >= self.log_batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered evaluation logs"""
+        _write_pending(self.logger, self._pending_logs, self._pending_lock)
@@ -2,25 +2,217 @@
 
 import inspect
 import ast
-from typing import List, Dict, Any, Tuple
+import keyword
+import linecache
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from .exceptions import SecurityError
 
 
+def _signature_annotations(func: Any) -> Tuple[Dict[str, Any], Any]:
+    """Annotated parameters and the return annotation of func's signature"""
+    signature = inspect.signature(func, follow_wrapped=True)
+    param_types = {
+        name: param.annotation
+        for name, param in signature.parameters.items()
+        if param.annotation is not inspect.Parameter.empty
+    }
+    return param_types, signature.return_annotation
+
+
+# Signatures do not change at runtime, so they are inspected once per function
+_cached_annotations = lru_cache(maxsize=256)(_signature_annotations)
+
+
+def _get_annotations(func: Any) -> Tuple[Dict[str, Any], Any]:
+    """Annotations of func, cached when func is hashable
+
+    The returned dict is shared between calls and must not be modified.
+    """
+    try:
+        hash(func)
+    except TypeError:
+        return _signature_annotations(func)
+    return _cached_annotations(func)
+
+
+def _source_line(frame: Any) -> str:
+    """Source line a frame is executing, or "" when the source is unavailable"""
+    # linecache keeps the file's lines cached, unlike inspect.getframeinfo
+    # which also builds a Traceback around a context window per call
+    return linecache.getline(frame.f_code.co_filename, frame.f_lineno)
+
+
+# Assignment target at the start of a line: everything before the first '='
+# that is not part of '=='; comparisons and call keywords do not parse as targets
+_LHS_RE = re.compile(r"^\s*([^=]+?)\s*=(?!=)")
+
+
+def _target_names(target: ast.AST) -> Optional[Tuple[str, ...]]:
+    """Names bound by an assignment target, None for unsupported targets"""
+    if isinstance(target, ast.Name):
+        return (target.id,)
+    if isinstance(target, ast.Attribute):
+        return (target.attr,)
+    if isinstance(target, ast.Starred):
+        return _target_names(target.value)
+    if isinstance(target, (ast.Tuple, ast.List)):
+        names = []
+        for element in target.elts:
+            element_names = _target_names(element)
+            if element_names is None or len(element_names) != 1:
+                return None
+            names.extend(element_names)
+        return tuple(names)
+    return None
+
+
+def _assignment_targets(line: str) -> Tuple[str, ...]:
+    """Names a line assigns to, or ("output",) for a standalone call"""
+    match = _LHS_RE.match(line)
+    if match is None:
+        return ("output",)
+    try:
+        statement = InferenceUtils.safe_parse_ast(f"{match.group(1)} = None").body[0]
+    except SecurityError:
+        # e.g. keyword arguments of a standalone call: predict(x, n=1)
+        return ("output",)
+    # Annotated assignments (name: str = ...) have a single target
+    if isinstance(statement, ast.AnnAssign):
+        target = statement.target
+    elif isinstance(statement, ast.Assign):
+        target = statement.targets[0]
+    else:
+        return ("output",)
+    return _target_names(target) or ("output",)
+
+
+@lru_cache(maxsize=2048)
+def _line_output_names(code: Any, lineno: int) -> Tuple[bool, Tuple[str, ...]]:
+    """Output names for the source line at a code location
+
+    Returns whether the line calls predict/chain_of_thought and the names it
+    assigns (empty without source). A code location always has the same line,
+    so repeated calls from a call site skip reading and splitting it.
+    """
+    line = linecache.getline(code.co_filename, lineno)
+    if not line:
+        return False, ()
+    is_call = "predict(" in line or "chain_of_thought(" in line
+    return is_call, _assignment_targets(line)
+
+
+# A single predict/chain_of_thought call without nested parentheses, and a
+# plain or self.<name> argument; lines matching these skip ast.parse
+_SIMPLE_CALL_RE = re.compile(r"\b(?:predict|chain_of_thought)\(([^()]*)\)")
+_SIMPLE_ARG_RE = re.compile(r"(self\.)?([A-Za-z_]\w*)")
+
+# Argument names that would clash with the caller's own parameters
+_RESERVED_NAMES = frozenset(("args", "kwargs", "self"))
+
+
+def _sanitize_arg_names(arg_names: List[str]) -> Tuple[str, ...]:
+    """Replace reserved argument names with their positional argX name"""
+    return tuple(
+        f"arg{i}" if name in _RESERVED_NAMES else name
+        for i, name in enumerate(arg_names)
+    )
+
+
+def _simple_call_arg_names(call_line: str) -> Optional[Tuple[str, ...]]:
+    """Argument names of a trivial call line, or None if it needs the parser"""
+    if call_line.count("(") != 1 or call_line.count(")") != 1:
+        return None
+    # Comments and string literals can hide or fake a call
+    if "#" in call_line or "'" in call_line or '"' in call_line:
+        return None
+    match = _SIMPLE_CALL_RE.search(call_line)
+    if match is None:
+        return None
+    arg_list = match.group(1).strip()
+    if not arg_list:
+        return ()
+    arg_names = []
+    for arg in arg_list.split(","):
+        arg_match = _SIMPLE_ARG_RE.fullmatch(arg.strip())
+        # Keywords such as None or True are constants, not variable names
+        if arg_match is None or keyword.iskeyword(arg_match.group(2)):
+            return None
+        # self.<name> uses the attribute name; other attributes need the parser
+        arg_names.append(arg_match.group(2))
+    return _sanitize_arg_names(arg_names)
+
+
+@lru_cache(maxsize=2048)
+def _call_arg_names(call_line: str) -> Optional[Tuple[str, ...]]:
+    """Argument names of the first call in a source line, memoized per line
+
+    A call site's line does not change between calls, so it is parsed once.
+    Returns None if the line contains no call; parse errors are raised (and
+    not cached).
+    """
+    if len(call_line) <= 1000:
+        arg_names = _simple_call_arg_names(call_line)
+        if arg_names is not None:
+            return arg_names
+
+    tree = InferenceUtils.safe_parse_ast(call_line)
+    call_node = None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            call_node = node
+            break
+    if call_node is None:
+        return None
+
+    arg_names = []
+    for arg in call_node.args:
+        if isinstance(arg, ast.Name):
+            name = arg.id
+            arg_names.append(name)
+        elif (
+            isinstance(arg, ast.Attribute)
+            and isinstance(arg.value, ast.Name)
+            and arg.value.id == "self"
+        ):
+            name = arg.attr
+            arg_names.append(name)
+        else:
+            # For any other type of node, assign argX name
+            arg_names.append(f"arg{len(arg_names)}")
+
+    # Sanitize reserved words
+    return _sanitize_arg_names(arg_names)
+
+
 class InferenceUtils:
     """Utilities for inferring variable names from calling context"""
     
     @staticmethod
-    def get_ast_depth(node: ast.AST, current_depth: int = 0) -> int:
-        """Calculate the depth of an AST node"""
+    def get_ast_depth(
+        node: ast.AST, current_depth: int = 0, limit: Optional[int] = None
+    ) -> int:
+        """Calculate the depth of an AST node
+
+        Walks the tree with an explicit stack, so deep input cannot hit the
+        recursion limit. With a limit, the walk stops as soon as a node deeper
+        than the limit is found and returns that node's depth.
+        """
         if not isinstance(node, ast.AST):
             return current_depth
-        
-        max_child_depth = current_depth
-        for child in ast.iter_child_nodes(node):
-            child_depth = InferenceUtils.get_ast_depth(child, current_depth + 1)
-            max_child_depth = max(max_child_depth, child_depth)
-        
-        return max_child_depth
+
+        max_depth = current_depth
+        stack = [(node, current_depth)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+                if limit is not None and depth > limit:
+                    break
+            stack.extend((child, depth + 1) for child in ast.iter_child_nodes(node))
+
+        return max_depth
     
     @staticmethod
     def safe_parse_ast(code: str, max_depth: int = 10) -> ast.AST:
@@ -33,7 +225,7 @@ class InferenceUtils:
             tree = ast.parse(code)
             
             # Check AST depth
-            if InferenceUtils.get_ast_depth(tree) > max_depth:
+            if InferenceUtils.get_ast_depth(tree, limit=max_depth) > max_depth:
                 raise SecurityError("AST too deep")
             
             return tree
@@ -47,41 +239,24 @@ class InferenceUtils:
             return ["output"]
 
         try:
-            # Get the code context lines
-            lines = inspect.getframeinfo(frame).code_context
-            if not lines:
-                return ["output"]
-            line = lines[0].strip()
+            is_call, names = _line_output_names(frame.f_code, frame.f_lineno)
+            if is_call or not names:
+                return list(names) or ["output"]
 
             # Skip frames that don't contain our actual call
             # Look for 'predict(' or 'chain_of_thought(' in the line
             max_depth = 5
-            current_frame = frame
-            for _ in range(max_depth):
+            current_frame = frame.f_back
+            for _ in range(max_depth - 1):
                 if current_frame is None:
                     break
-                lines = inspect.getframeinfo(current_frame).code_context
-                if lines and (
-                    "predict(" in lines[0] or "chain_of_thought(" in lines[0]
-                ):
-                    line = lines[0].strip()
-                    break
+                is_call, outer_names = _line_output_names(
+                    current_frame.f_code, current_frame.f_lineno
+                )
+                if is_call:
+                    return list(outer_names)
                 current_frame = current_frame.f_back
-
-            # Handle multi-line assignment
-            if "=" in line:
-                lhs = line.split("=")[0].strip()
-                # Handle tuple assignment: name1, name2 = ...
-                if "," in lhs:
-                    output_names = [name.strip() for name in lhs.split(",")]
-                # Handle single assignment: name = ...
-                else:
-                    output_names = [lhs]
-            # Handle no assignment (standalone call)
-            else:
-                output_names = ["output"]
-
-            return output_names
+            return list(names)
         except (AttributeError, IndexError, TypeError):
             return ["output"]
     
@@ -92,50 +267,20 @@ class InferenceUtils:
             if frame is None:
                 return [f"arg{i}" for i in range(len(args))]
 
-            # Get the code context of the call
-            context_lines = inspect.getframeinfo(frame).code_context
-            if not context_lines:
+            # Get the source line of the call
+            call_line = _source_line(frame).strip()
+            if not call_line:
                 return [f"arg{i}" for i in range(len(args))]
 
-            call_line = context_lines[0].strip()
-
             # Try the AST method with safety checks
             try:
-                tree = InferenceUtils.safe_parse_ast(call_line)
-                call_node = None
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Call):
-                        call_node = node
-                        break
-                if call_node is None:
-                    return [f"arg{i}" for i in range(len(args))]
-
-                arg_names = []
-                for arg in call_node.args:
-                    if isinstance(arg, ast.Name):
-                        name = arg.id
-                        arg_names.append(name)
-                    elif (
-                        isinstance(arg, ast.Attribute)
-                        and isinstance(arg.value, ast.Name)
-                        and arg.value.id == "self"
-                    ):
-                        name = arg.attr
-                        arg_names.append(name)
-                    else:
-                        # For any other type of node, assign argX name
-                        arg_names.append(f"arg{len(arg_names)}")
-
-                # Sanitize reserved words
-                reserved = ["args", "kwargs", "self"]
-                for i, name in enumerate(arg_names):
-                    if name in reserved:
-                        arg_names[i] = f"arg{i}"
-
-                return arg_names
+                arg_names = _call_arg_names(call_line)
             except (SyntaxError, TypeError, ValueError):
                 # If AST method fails, fall back to arg0, arg1, ...
                 return [f"arg{i}" for i in range(len(args))]
+            if arg_names is None:
+                return [f"arg{i}" for i in range(len(args))]
+            return list(arg_names)
         except (AttributeError, ValueError, IndexError, TypeError):
             return [f"arg{i}" for i in range(len(args))]
     
@@ -169,18 +314,14 @@ class InferenceUtils:
 
             if func and callable(func):
                 try:
-                    signature = inspect.signature(func, follow_wrapped=True)
+                    param_types, return_ann = _get_annotations(func)
 
                     # Get input parameter types
-                    for param_name, param in signature.parameters.items():
-                        if (
-                            param_name in input_names
-                            and param.annotation != inspect.Parameter.empty
-                        ):
-                            input_types[param_name] = param.annotation
+                    for name in input_names:
+                        if name in param_types:
+                            input_types[name] = param_types[name]
 
                     # Get return type hints
-                    return_ann = signature.return_annotation
                     InferenceUtils._process_return_annotation(
                         return_ann, output_names, output_types
                     )
@@ -6,10 +6,18 @@ Features:
 """
 
 import json
+import os
 import re
-from datetime import datetime
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
+
+try:  # Optional: C-implemented JSON encoding for the logging hot path
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -22,41 +30,94 @@ class CustomJSONEncoder(json.JSONEncoder):
             return str(o)
 
 
+def _dumps_line(data: Dict[str, Any]) -> bytes:
+    """Serialize a record as one UTF-8 JSON line"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:  # e.g. integers beyond 64 bits
+            pass
+    return (json.dumps(data, cls=CustomJSONEncoder) + "\n").encode("utf-8")
+
+
+# Both parsers accept bytes and raise ValueError subclasses on invalid input
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+# The formatted date and time of the last second a timestamp was made for
+_last_second = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601 format with a 'T' separator and 'Z' suffix"""
+    global _last_second  # pylint: disable=global-statement
+    now = time.time()
+    second = int(now)
+    # Only the sub-second part changes between records in the same second
+    cached_second, prefix = _last_second
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _last_second = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1e6):06d}Z"
+
+
+def _close_handles(handles: Dict[Path, int]) -> None:
+    """Close the open log file descriptors of a Logger"""
+    for fd in handles.values():
+        os.close(fd)
+    handles.clear()
+
+
+def _open_append(path: Path) -> int:
+    """Open a file for appending, creating it if needed"""
+    return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
 class Logger:
-    """Handles logging of DSPy inputs and outputs per module"""
+    """Handles logging of DSPy inputs and outputs per module
+
+    The module directory and log files are created on the first write, so a
+    Logger used only for reading does no I/O up front. Log files are kept open
+    once written; call close() to release them early, they are reopened on the
+    next write. Otherwise they are closed when the Logger is garbage collected
+    or at interpreter exit.
+    """
 
     def __init__(self, module_name: str, base_dir: str = ".simpledspy") -> None:
         # Sanitize module_name to prevent path traversal
         safe_name = re.sub(r'[^a-zA-Z0-9_\-]', '_', module_name)
         safe_name = safe_name.replace('..', '_')
-        
-        # Create base directory
+
         self.base_dir = Path(base_dir) / "modules" / safe_name
-        self.base_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create files for training and logged data
+        # Files for training and logged data
         self.training_file = self.base_dir / "training.jsonl"
         self.logged_file = self.base_dir / "logged.jsonl"
 
-        # Create files if they don't exist
-        for file in [self.training_file, self.logged_file]:
-            if not file.exists():
-                file.touch()
+        # Append descriptors, opened on first write
+        self._handles: Dict[Path, int] = {}
+        self._handles_lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _close_handles, self._handles)
 
     def load_training_data(self) -> list:
         """Load training data from the training file, skipping empty lines and invalid JSON"""
         examples = []
         if self.training_file.exists():
-            with open(self.training_file, "r", encoding="utf-8") as f:
+            # Lines are parsed straight from bytes, skipping text decoding
+            with open(self.training_file, "rb") as f:
                 for line in f:
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        data = json.loads(line)
+                        data = _loads(line)
                         # Include any valid JSON in training file
                         examples.append(data)
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:  # invalid JSON or UTF-8
                         # Log the error but continue processing other lines
                         print(
                             f"Warning: Skipping invalid JSON line in {self.training_file}: {e}"
@@ -73,12 +134,54 @@ class Logger:
         """
         # Add section marker
         data["section"] = section
-        # Use ISO 8601 format with 'T' separator
-        data["timestamp"] = datetime.utcnow().isoformat() + "Z"
+        data["timestamp"] = _utc_timestamp()
+        self._append(section, _dumps_line(data))
+
+    def log_many(
+        self, records: Iterable[Dict[str, Any]], section: str = "logged"
+    ) -> None:
+        """Log several dictionaries to a section with a single write
+
+        Args:
+            records: Dictionaries of data to log
+            section: Either 'training' or 'logged'
+        """
+        lines = []
+        for data in records:
+            data["section"] = section
+            data["timestamp"] = _utc_timestamp()
+            lines.append(_dumps_line(data))
+        if lines:
+            self._append(section, b"".join(lines))
+
+    def _append(self, section: str, payload: bytes) -> None:
+        """Append encoded lines to a section's file through its persistent descriptor
+
+        Unbuffered O_APPEND writes put every payload at the end of the file, so
+        lines from other processes logging to the same file do not interleave.
+        """
         target_file = self.training_file if section == "training" else self.logged_file
+        with self._handles_lock:
+            fd = self._handles.get(target_file)
+            # Reopen a file deleted while open (e.g. with its log directory),
+            # so records do not go to an unlinked file
+            if fd is not None and os.fstat(fd).st_nlink == 0:
+                os.close(fd)
+                fd = None
+            if fd is None:
+                # Creating the file by opening it with O_CREAT saves separate
+                # exists()/touch() calls
+                self.base_dir.mkdir(parents=True, exist_ok=True)
+                fd = _open_append(target_file)
+                self._handles[target_file] = fd
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
 
-        with open(target_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(data, cls=CustomJSONEncoder) + "\n")
+    def close(self) -> None:
+        """Close the log files; they are reopened if the Logger is used again"""
+        with self._handles_lock:
+            _close_handles(self._handles)
 
     def log(self, data: Dict[str, Any]) -> None:
         """Log data to the 'logged' section by default"""
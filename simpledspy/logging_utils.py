@@ -1,12 +1,37 @@
 """Utilities for logging module results"""
 
+import atexit
+import os
+import threading
+from functools import lru_cache
 from typing import List, Dict, Any
 from .logger import Logger
 from .settings import settings as global_settings
 
 
+@lru_cache(maxsize=64)
+def _get_logger(module_name: str, base_dir: str) -> Logger:
+    """Logger for a module in a log directory, reused across calls
+
+    Loggers keep their files open, so repeated calls skip creating the module
+    directory and opening its files again. base_dir must be absolute, so a
+    later os.chdir does not keep writing to the old directory.
+    """
+    return Logger(module_name=module_name, base_dir=base_dir)
+
+
 class LoggingUtils:
-    """Utilities for logging module execution results"""
+    """Utilities for logging module execution results
+
+    With settings.log_buffer_size > 1, records are buffered and written per
+    module in one append once that many are pending; flush() writes them early
+    and anything left is written at interpreter exit.
+    """
+
+    # Buffered records per (module name, log directory)
+    _pending: Dict[tuple, List[Dict[str, Any]]] = {}
+    _pending_count = 0
+    _pending_lock = threading.Lock()
     
     @staticmethod
     def log_results(
@@ -18,6 +43,81 @@ class LoggingUtils:
         description: str = None,
     ):
         """Log module inputs and outputs with meaningful names"""
+        LoggingUtils._write(
+            module_name,
+            [
+                LoggingUtils._record(
+                    module_name,
+                    input_dict,
+                    input_names,
+                    output_names,
+                    output_values,
+                    description,
+                )
+            ],
+        )
+
+    @staticmethod
+    def log_batch(
+        module_name: str,
+        input_dicts: List[Dict[str, Any]],
+        input_names: List[str],
+        output_names: List[str],
+        output_values: List[List[Any]],
+        description: str = None,
+    ):
+        """Log the results of several calls of one module with a single write"""
+        LoggingUtils._write(
+            module_name,
+            [
+                LoggingUtils._record(
+                    module_name,
+                    input_dict,
+                    input_names,
+                    output_names,
+                    values,
+                    description,
+                )
+                for input_dict, values in zip(input_dicts, output_values)
+            ],
+        )
+
+    @staticmethod
+    def flush():
+        """Write all buffered records"""
+        with LoggingUtils._pending_lock:
+            pending, LoggingUtils._pending = LoggingUtils._pending, {}
+            LoggingUtils._pending_count = 0
+        for (module_name, base_dir), records in pending.items():
+            _get_logger(module_name, base_dir).log_many(records)
+
+    @staticmethod
+    def _write(module_name: str, records: List[Dict[str, Any]]):
+        """Write records for a module now, or buffer them when buffering is on"""
+        base_dir = os.path.abspath(global_settings.log_dir or ".simpledspy")
+        if global_settings.log_buffer_size <= 1:
+            _get_logger(module_name, base_dir).log_many(records)
+            return
+
+        with LoggingUtils._pending_lock:
+            LoggingUtils._pending.setdefault((module_name, base_dir), []).extend(
+                records
+            )
+            LoggingUtils._pending_count += len(records)
+            full = LoggingUtils._pending_count >= global_settings.log_buffer_size
+        if full:
+            LoggingUtils.flush()
+
+    @staticmethod
+    def _record(
+        module_name: str,
+        input_dict: Dict[str, Any],
+        input_names: List[str],
+        output_names: List[str],
+        output_values: List[Any],
+        description: str = None,
+    ) -> Dict[str, Any]:
+        """Log record of one call with both names and values"""
         # Create input structure with both names and values
         inputs_data = []
         for name in input_names:
@@ -29,14 +129,13 @@ class LoggingUtils:
         for i, name in enumerate(output_names):
             outputs_data.append({"name": name, "value": output_values[i]})
 
-        # Create logger for this specific module
-        base_dir = global_settings.log_dir if global_settings.log_dir else ".simpledspy"
-        logger = Logger(module_name=module_name, base_dir=base_dir)
-        logger.log(
-            {
-                "module": module_name,
-                "inputs": inputs_data,
-                "outputs": outputs_data,
-                "description": description,
-            }
-        )
+        return {
+            "module": module_name,
+            "inputs": inputs_data,
+            "outputs": outputs_data,
+            "description": description,
+        }
+
+
+# Write out anything still buffered when the interpreter exits
+atexit.register(LoggingUtils.flush)
@@ -1,24 +1,62 @@
 """Metrics for DSPy modules"""
 
+import sys
 from typing import Any
 
+__all__ = ["dict_exact_match_metric"]
 
-def dict_exact_match_metric(example: dict, prediction: dict, _: Any = None) -> float:
-    """Calculates exact match score between example and prediction"""
+# Sentinel for keys missing from the prediction (None is a valid value)
+_MISSING = object()
+
+
+# Precomputed keys for positional outputs, reused across calls
+_OUTPUT_KEYS = tuple(sys.intern(f"output_{i}") for i in range(32))
+
+
+def _tuple_to_dict(prediction: tuple) -> dict:
+    """Map positional outputs to output_0, output_1, ..."""
+    if len(prediction) <= len(_OUTPUT_KEYS):
+        return dict(zip(_OUTPUT_KEYS, prediction))
+    return {f"output_{i}": val for i, val in enumerate(prediction)}
+
+
+def _normalize_prediction(prediction: Any) -> dict:
+    """Normalize predictions of any other type, including subclasses"""
+    if isinstance(prediction, dict):
+        return prediction
+    if isinstance(prediction, tuple):
+        return _tuple_to_dict(prediction)
+    return {"output": prediction}
+
+
+# Normalizers keyed by exact prediction type; anything else falls back to
+# _normalize_prediction
+_NORMALIZERS = {tuple: _tuple_to_dict}
+
+
+def dict_exact_match_metric(example: dict, prediction: dict, _: Any = None, /) -> float:
+    """Calculates exact match score between example and prediction
+
+    Arguments are positional-only; the third (the DSPy trace) is ignored.
+    """
     if not example:
         return 1.0 if not prediction else 0.0
 
-    if not isinstance(prediction, dict):
-        if isinstance(prediction, tuple):
-            prediction = {f"output_{i}": val for i, val in enumerate(prediction)}
-        else:
-            prediction = {"output": prediction}
+    prediction_type = type(prediction)
+    if prediction_type is not dict:
+        prediction = _NORMALIZERS.get(prediction_type, _normalize_prediction)(
+            prediction
+        )
+
+    # Whole-dict comparison runs in C and settles the common full match
+    if prediction == example:
+        return 1.0
 
+    get = prediction.get
     score = 0
-    total = 0
     for key, value in example.items():
-        total += 1
-        if key in prediction and prediction[key] == value:
+        if get(key, _MISSING) == value:
             score += 1
 
-    return score / total if total > 0 else 0.0
+    # example is non-empty here, so the division is safe
+    return score / len(example)
@@ -3,9 +3,10 @@
 Provides base classes for Predict and ChainOfThought function calls
 """
 
-import inspect
+import sys
 import threading
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Dict, Any, Tuple
 import dspy
 from .module_factory import ModuleFactory
 from .optimization_manager import OptimizationManager
@@ -16,29 +17,62 @@ from .inference_utils import InferenceUtils
 from .training_utils import TrainingUtils
 from .logging_utils import LoggingUtils
 
+# Sentinel for output fields missing from a prediction
+_MISSING = object()
+
+# Generation parameters accepted in lm_params, besides the keyword arguments
+# the LM itself was created with
+LM_PARAMS = frozenset(
+    (
+        "cache",
+        "frequency_penalty",
+        "logprobs",
+        "max_completion_tokens",
+        "max_tokens",
+        "n",
+        "num_retries",
+        "presence_penalty",
+        "reasoning_effort",
+        "response_format",
+        "seed",
+        "stop",
+        "temperature",
+        "top_logprobs",
+        "top_p",
+    )
+)
+
+# Upper bound on LM copies kept per caller for distinct lm_params
+MAX_CACHED_LMS = 64
+
 
 class BaseCaller:
     """Base class for DSPy module callers"""
 
     _instances = {}
     _lock = threading.Lock()
+    _module_type = "basecaller"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Used in generated module names; computed once per class
+        cls._module_type = cls.__name__.lower()
 
     def __new__(cls):
+        # Fast path without the lock: instances are only published once set up
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls not in cls._instances:
                 instance = super().__new__(cls)
-                cls._instances[cls] = instance
                 instance.module_factory = ModuleFactory()
                 instance.optimization_manager = OptimizationManager()
-                # Use default LM from settings if available, otherwise use the global lm
-                if global_settings.default_lm:
-                    instance.lm = dspy.LM(model=global_settings.default_lm)
-                elif global_settings.lm:
-                    instance.lm = global_settings.lm
-                else:
-                    instance.lm = dspy.LM(model="openai/gpt-3.5-turbo")
-                dspy.configure(lm=instance.lm, cache=False)
-                
+                instance.lm, instance._lm_spec = cls._default_lm()
+                cls._configure_lm(instance)
+                # LM copies per distinct lm_params, see _override_lm
+                instance._lm_copies = {}
+
                 # Initialize retry config
                 retry_attempts = getattr(global_settings, 'retry_attempts', 3)
                 retry_delay = getattr(global_settings, 'retry_delay', 1.0)
@@ -46,8 +80,55 @@ class BaseCaller:
                     max_attempts=retry_attempts,
                     initial_delay=retry_delay
                 )
+                cls._instances[cls] = instance
             return cls._instances[cls]
 
+    @classmethod
+    def _default_lm(cls):
+        """Create the LM described by the global settings
+
+        Returns the LM and the (model, kwargs) spec it was built from, or None
+        for an LM object taken from settings.lm. A caller whose spec matches
+        an existing caller's gets a copy of that LM, so no caller can change
+        the settings of another one's LM.
+        """
+        # Use default LM from settings if available, otherwise use the global lm
+        if not global_settings.default_lm and global_settings.lm:
+            return global_settings.lm, None
+        model = global_settings.default_lm or "openai/gpt-3.5-turbo"
+        lm_kwargs = global_settings.lm_kwargs()
+        spec = (model, sorted(lm_kwargs.items()))
+        for other in cls._instances.values():
+            if getattr(other, "_lm_spec", None) == spec:
+                return other.lm.copy(), spec
+        return dspy.LM(model=model, **lm_kwargs), spec
+
+    @classmethod
+    def _configure_lm(cls, instance):
+        """Make the caller's LM the dspy LM unless an equivalent one already is"""
+        current = dspy.settings.lm
+        if current is instance.lm:
+            return
+        # A sibling's LM with the same spec is as good as this caller's copy
+        if instance._lm_spec is not None and any(
+            other.lm is current and other._lm_spec == instance._lm_spec
+            for other in cls._instances.values()
+        ):
+            return
+        dspy.configure(lm=instance.lm)
+
+    @classmethod
+    def refresh_lm(cls):
+        """Rebuild the LM of existing callers after the settings changed"""
+        with cls._lock:
+            # Drop old specs first so callers do not reuse a stale LM
+            for instance in cls._instances.values():
+                instance._lm_spec = None
+                instance._lm_copies.clear()
+            for instance in cls._instances.values():
+                instance.lm, instance._lm_spec = cls._default_lm()
+                cls._configure_lm(instance)
+
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def _create_module(
         self,
@@ -77,35 +158,94 @@ class BaseCaller:
         return InferenceUtils.get_type_hints_from_signature(frame, input_names, output_names)
 
     
-    def _infer_input_names(self, args) -> List[str]:
+    def _infer_input_names(self, args, frame: Any = None) -> List[str]:
         """Infer input variable names using frame inspection"""
         try:
-            # Need to go back 3 frames now due to refactoring
-            frame = inspect.currentframe().f_back.f_back.f_back
             return InferenceUtils.infer_input_names(args, frame)
         except (AttributeError, ValueError, IndexError, TypeError):
             return [f"arg{i}" for i in range(len(args))]
 
-    def _run_module(self, module, input_dict, lm_params):
-        """Run the module with optional LM parameter overrides and retry logic"""
+    def _override_lm(self, lm_params):
+        """Copy of the LM carrying the settings in lm_params, or None
+
+        The shared LM is never mutated, so concurrent calls without lm_params
+        keep its settings. Copies are reused for repeated lm_params.
+        """
+        overrides = {
+            key: value
+            for key, value in (lm_params or {}).items()
+            if key != "logging_enabled"
+        }
+        if not overrides:
+            return None
+
+        lm = self.lm
+        lm_kwargs = getattr(lm, "kwargs", None)
+        unknown = [
+            key
+            for key in overrides
+            if key not in LM_PARAMS
+            and not (isinstance(lm_kwargs, dict) and key in lm_kwargs)
+        ]
+        if unknown:
+            raise ValidationError(f"Unknown lm_params: {', '.join(sorted(unknown))}")
+
+        try:
+            key = tuple(sorted(overrides.items()))
+            cached = self._lm_copies.get(key)
+        except TypeError:  # unhashable value, e.g. a list of stop sequences
+            key = None
+            cached = None
+        # A copy is only valid for the LM it was made from
+        if cached is not None and cached[0] is lm:
+            return cached[1]
+
+        lm_copy = lm.copy(**overrides)
+        if key is not None:
+            with self._lock:
+                if len(self._lm_copies) >= MAX_CACHED_LMS:
+                    self._lm_copies.pop(next(iter(self._lm_copies)))
+                self._lm_copies[key] = (lm, lm_copy)
+        return lm_copy
+
+    def _run_module(self, module, input_dict, lm_params, lm=None):
+        """Run the module with optional LM parameter overrides and retry logic
+
+        lm, if given, is an LM already built by _override_lm and takes the
+        place of lm_params.
+        """
+        if lm is None:
+            lm = self._override_lm(lm_params)
+
         @with_retry(self.retry_config)
         def _execute():
-            if lm_params:
-                original_params = {}
-                for key, value in lm_params.items():
-                    if hasattr(self.lm, key):
-                        original_params[key] = getattr(self.lm, key)
-                        setattr(self.lm, key, value)
-                try:
-                    return module(**input_dict)
-                finally:
-                    for key, value in original_params.items():
-                        setattr(self.lm, key, value)
-            else:
+            if lm is None:
                 return module(**input_dict)
-        
+            with dspy.context(lm=lm):
+                return module(**input_dict)
+
         return _execute()
 
+    @staticmethod
+    def _output_values(prediction_result, output_names: List[str]) -> List[Any]:
+        """Collect the output fields of a prediction, in output_names order"""
+        output_values = []
+        for output_name in output_names:
+            value = getattr(prediction_result, output_name, _MISSING)
+            if value is _MISSING:
+                raise AttributeError(
+                    f"Output field '{output_name}' not found in prediction result"
+                )
+            output_values.append(value)
+        return output_values
+
+    @staticmethod
+    def _logging_enabled(lm_params: dict = None) -> bool:
+        """Whether results are logged, allowing a per-call override"""
+        if lm_params and "logging_enabled" in lm_params:
+            return lm_params["logging_enabled"]
+        return global_settings.logging_enabled
+
     def _log_results(
         self,
         module_name,
@@ -121,22 +261,29 @@ class BaseCaller:
         )
 
 
-    def _prepare_input_names(self, args: tuple, inputs: List[str] = None) -> List[str]:
-        """Prepare and sanitize input names"""
+    def _prepare_input_names(
+        self, args: tuple, inputs: List[str] = None, frame: Any = None
+    ) -> List[str]:
+        """Prepare and sanitize input names
+
+        frame is the caller's frame, which names are inferred from.
+        """
         if inputs is None:
-            # Capture variables and infer names
-            captured_vars = {}
+            # Map the argument values to the caller's variable names in one
+            # scan, keeping only names bound to one of the arguments
+            arg_ids = {id(arg) for arg in args}
+            value_to_name = {}
             try:
-                # Need to go back 3 frames due to refactoring
-                frame = inspect.currentframe().f_back.f_back.f_back
-                captured_vars = {**frame.f_locals, **frame.f_globals} if frame else {}
+                namespaces = (frame.f_locals, frame.f_globals) if frame else ()
+                for namespace in namespaces:
+                    for var_name, value in namespace.items():
+                        if id(value) in arg_ids:
+                            value_to_name[id(value)] = var_name
             except (AttributeError, ValueError, IndexError, TypeError):
-                captured_vars = {}
+                value_to_name = {}
 
             try:
-                input_names = self._infer_input_names(args)
-                # Map from values to names for preserving original names
-                value_to_name = {id(v): name for name, v in captured_vars.items()}
+                input_names = self._infer_input_names(args, frame)
                 # Try to map each argument to its original name
                 reserved = ["args", "kwargs", "self"]
                 for idx, arg in enumerate(args):
@@ -165,12 +312,12 @@ class BaseCaller:
 
         return input_names
 
-    def _prepare_output_names(self, outputs: List[str] = None) -> List[str]:
-        """Prepare output names"""
+    def _prepare_output_names(
+        self, outputs: List[str] = None, frame: Any = None
+    ) -> List[str]:
+        """Prepare output names, inferred from the caller's frame if not given"""
         if outputs is None:
             try:
-                # Need to go back 3 frames due to refactoring
-                frame = inspect.currentframe().f_back.f_back.f_back
                 output_names = self._infer_output_names(frame)
             except (AttributeError, ValueError, IndexError, TypeError):
                 output_names = ["output"]
@@ -183,16 +330,9 @@ class BaseCaller:
         input_names: List[str],
         output_names: List[str],
         description: str = None,
+        frame: Any = None,
     ) -> Tuple[dspy.Module, Dict[str, type], Dict[str, type]]:
-        """Prepare module with type hints"""
-        # Get type hints from caller context
-        input_types = {}
-        output_types = {}
-        try:
-            # Need to go back 3 frames due to refactoring
-            frame = inspect.currentframe().f_back.f_back.f_back
-        except (AttributeError, ValueError, IndexError, TypeError):
-            frame = None
+        """Prepare module with type hints from the caller's frame"""
         input_types, output_types = self._get_call_types_from_signature(
             frame, input_names, output_names
         )
@@ -231,23 +371,11 @@ class BaseCaller:
         # Run module with optional parameters
         prediction_result = self._run_module(module, input_dict, lm_params)
 
-        # Process and validate results
-        for output_name in output_names:
-            if not hasattr(prediction_result, output_name):
-                raise AttributeError(
-                    f"Output field '{output_name}' not found in prediction result"
-                )
-        output_values = [
-            getattr(prediction_result, output_name) for output_name in output_names
-        ]
-
-        # Check if logging is enabled
-        logging_enabled = global_settings.logging_enabled
-        if lm_params and "logging_enabled" in lm_params:
-            logging_enabled = lm_params["logging_enabled"]
+        # Collect and validate results in a single pass
+        output_values = self._output_values(prediction_result, output_names)
 
         # Log results if enabled
-        if logging_enabled:
+        if self._logging_enabled(lm_params):
             self._log_results(
                 name, input_dict, input_names, output_names, output_values, description
             )
@@ -269,33 +397,24 @@ class BaseCaller:
         # Validate inputs
         if not args:
             raise ValidationError("At least one argument is required")
-        
-        if lm_params is not None and not isinstance(lm_params, dict):
-            raise ValidationError("lm_params must be a dictionary")
-        
-        if inputs is not None and not isinstance(inputs, list):
-            raise ValidationError("inputs must be a list of strings")
-        
-        if outputs is not None and not isinstance(outputs, list):
-            raise ValidationError("outputs must be a list of strings")
-        
-        if trainset is not None and not isinstance(trainset, list):
-            raise ValidationError("trainset must be a list")
-        
+        self._validate_options(inputs, outputs, lm_params, trainset)
+
+        # The caller's frame is looked up once and shared by all inference steps
+        frame = None
+        if global_settings.introspection_enabled:
+            frame = sys._getframe(1)  # pylint: disable=protected-access
+
         # Prepare input and output names
-        input_names = self._prepare_input_names(args, inputs)
-        output_names = self._prepare_output_names(outputs)
+        input_names = self._prepare_input_names(args, inputs, frame)
+        output_names = self._prepare_output_names(outputs, frame)
 
         # Generate module name if not provided
         if name is None:
-            output_part = "_".join(output_names)
-            module_type = self.__class__.__name__.lower()
-            input_part = "_".join(input_names)
-            name = f"{output_part}__{module_type}__{input_part}"
+            name = self._default_name(input_names, output_names)
 
         # Create and configure module
         module, _, _ = self._prepare_module(
-            input_names, output_names, description
+            input_names, output_names, description, frame
         )
 
         # Apply training data
@@ -306,6 +425,102 @@ class BaseCaller:
             module, args, input_names, output_names, name, description, lm_params
         )
 
+    def batch(
+        self,
+        arg_tuples: Iterable[Any],
+        *,
+        inputs: List[str] = None,
+        outputs: List[str] = None,
+        description: str = None,
+        lm_params: dict = None,
+        name: str = None,
+        trainset: list = None,
+    ) -> List[Any]:
+        """Run one module on several sets of arguments concurrently
+
+        Each item of arg_tuples holds the positional arguments of one call (a
+        non-tuple item is a single argument). All calls share one module and
+        up to settings.num_threads run at once. Names are not inferred from
+        the calling line: fields default to arg0, arg1, ... and output unless
+        inputs/outputs are given. Returns one result per item, in order.
+        """
+        self._validate_options(inputs, outputs, lm_params, trainset)
+        arg_tuples = [
+            args if isinstance(args, tuple) else (args,) for args in arg_tuples
+        ]
+        if not arg_tuples:
+            return []
+        arity = len(arg_tuples[0])
+        if arity == 0 or any(len(args) != arity for args in arg_tuples):
+            raise ValidationError(
+                "Every batch item needs the same, non-zero number of arguments"
+            )
+
+        frame = None
+        if global_settings.introspection_enabled:
+            frame = sys._getframe(1)  # pylint: disable=protected-access
+        input_names = self._prepare_input_names(arg_tuples[0], inputs)
+        output_names = self._prepare_output_names(outputs)
+        if name is None:
+            name = self._default_name(input_names, output_names)
+        module, _, _ = self._prepare_module(
+            input_names, output_names, description, frame
+        )
+        self._apply_training_data(module, trainset, name)
+
+        input_dicts = [dict(zip(input_names, args)) for args in arg_tuples]
+        max_workers = min(len(input_dicts), global_settings.num_threads)
+        # One LM copy serves the whole batch; dspy.context is per thread, so
+        # each call enters it itself
+        lm = self._override_lm(lm_params)
+        if max_workers <= 1:
+            predictions = [
+                self._run_module(module, input_dict, None, lm)
+                for input_dict in input_dicts
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                predictions = list(
+                    executor.map(
+                        lambda input_dict: self._run_module(
+                            module, input_dict, None, lm
+                        ),
+                        input_dicts,
+                    )
+                )
+
+        output_values = [
+            self._output_values(prediction, output_names) for prediction in predictions
+        ]
+        if self._logging_enabled(lm_params):
+            LoggingUtils.log_batch(
+                name, input_dicts, input_names, output_names, output_values, description
+            )
+        return [
+            values[0] if len(values) == 1 else tuple(values) for values in output_values
+        ]
+
+    @staticmethod
+    def _validate_options(inputs, outputs, lm_params, trainset):
+        """Check the types of the keyword options of a call"""
+        if lm_params is not None and not isinstance(lm_params, dict):
+            raise ValidationError("lm_params must be a dictionary")
+        
+        if inputs is not None and not isinstance(inputs, list):
+            raise ValidationError("inputs must be a list of strings")
+        
+        if outputs is not None and not isinstance(outputs, list):
+            raise ValidationError("outputs must be a list of strings")
+        
+        if trainset is not None and not isinstance(trainset, list):
+            raise ValidationError("trainset must be a list")
+
+    def _default_name(self, input_names: List[str], output_names: List[str]) -> str:
+        """Module name derived from the field names, used for logs and training data"""
+        output_part = "_".join(output_names)
+        input_part = "_".join(input_names)
+        return f"{output_part}__{self._module_type}__{input_part}"
+
 
 # pylint: disable=too-few-public-methods
 class Predict(BaseCaller):
@@ -324,7 +539,7 @@ class ChainOfThought(BaseCaller):
         output_types: Dict[str, type] = None,
         description: str = "",
     ) -> dspy.Module:
-        signature_class = self.module_factory.create_signature(
+        signature_class = self.module_factory.get_signature(
             inputs=inputs,
             outputs=outputs,
             input_types=input_types,
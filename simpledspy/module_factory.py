@@ -1,12 +1,21 @@
 """Factory for creating DSPy signatures and modules"""
 
+import inspect
+import threading
 from typing import List, Dict
 import dspy
 
+# Upper bound on cached signature classes per factory
+MAX_CACHED_SIGNATURES = 1024
+
 
 class ModuleFactory:
     """Factory for creating DSPy signatures and modules"""
 
+    def __init__(self):
+        self._signature_cache = {}
+        self._cache_lock = threading.Lock()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def create_signature(
         self,
@@ -16,7 +25,12 @@ class ModuleFactory:
         output_types: Dict[str, type] = None,
         description: str = "",
     ) -> dspy.Signature:
-        """Create DSPy signature from inputs/outputs"""
+        """Create DSPy signature from inputs/outputs
+
+        The instructions form the static head of the rendered prompt, ahead of
+        the per-call field values, so they are normalized to be byte-identical
+        across calls and keep provider prompt caches warm.
+        """
         signature_fields = {}
 
         # Create inputs with type annotations
@@ -31,7 +45,7 @@ class ModuleFactory:
 
         # Create better default instructions
         if description:
-            instructions = description
+            instructions = inspect.cleandoc(description)
         elif inputs and outputs:
             instructions = (
                 f"Process inputs ({', '.join(inputs)}) to "
@@ -59,8 +73,13 @@ class ModuleFactory:
         output_types: Dict[str, type] = None,
         description: str = "",
     ) -> dspy.Module:
-        """Create DSPy module with specified signature"""
-        signature_class = self.create_signature(
+        """Create DSPy module with specified signature
+
+        Signature classes are cached per specification. The module itself is
+        created fresh on every call because it carries per-call state such as
+        demos.
+        """
+        signature_class = self.get_signature(
             inputs=inputs,
             outputs=outputs,
             input_types=input_types,
@@ -69,3 +88,45 @@ class ModuleFactory:
         )
 
         return dspy.Predict(signature_class)
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def get_signature(
+        self,
+        inputs: List[str],
+        outputs: List[str],
+        input_types: Dict[str, type] = None,
+        output_types: Dict[str, type] = None,
+        description: str = "",
+    ) -> dspy.Signature:
+        """Return a cached signature class, creating it on first use"""
+        key = (
+            tuple(inputs),
+            tuple(outputs),
+            tuple(input_types.get(inp, str) for inp in inputs) if input_types else None,
+            (
+                tuple(output_types.get(outp, str) for outp in outputs)
+                if output_types
+                else None
+            ),
+            description,
+        )
+        try:
+            signature_class = self._signature_cache.get(key)
+        except TypeError:  # unhashable type annotation
+            key = None
+            signature_class = None
+
+        if signature_class is None:
+            signature_class = self.create_signature(
+                inputs=inputs,
+                outputs=outputs,
+                input_types=input_types,
+                output_types=output_types,
+                description=description,
+            )
+            if key is not None:
+                with self._cache_lock:
+                    if len(self._signature_cache) >= MAX_CACHED_SIGNATURES:
+                        self._signature_cache.pop(next(iter(self._signature_cache)))
+                    self._signature_cache[key] = signature_class
+        return signature_class
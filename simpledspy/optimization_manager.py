@@ -11,6 +11,7 @@ This module provides the OptimizationManager class which:
 import dspy
 from dspy.teleprompt import BootstrapFewShot, MIPROv2, BootstrapFewShotWithRandomSearch
 from .metrics import dict_exact_match_metric
+from .settings import settings as global_settings
 
 
 class OptimizationManager:
@@ -27,6 +28,7 @@ class OptimizationManager:
             "max_bootstrapped_demos": 4,
             "max_labeled_demos": 4,
             "max_demos": 10,
+            "num_threads": None,  # None uses settings.num_threads
         }
         self._teleprompters = {
             "bootstrap_few_shot": BootstrapFewShot,
@@ -44,6 +46,8 @@ class OptimizationManager:
         strategy = self._config["strategy"]
         if strategy not in self._teleprompters:
             raise KeyError(f"Unknown optimization strategy: {strategy}")
+        # Candidate programs are scored on the trainset in parallel
+        num_threads = self._config.get("num_threads") or global_settings.num_threads
 
         # Different teleprompters have different parameter requirements
         if strategy == "bootstrap_few_shot":
@@ -53,17 +57,21 @@ class OptimizationManager:
                 max_labeled_demos=self._config["max_labeled_demos"],
             )
         if strategy == "mipro":
-            return self._teleprompters[strategy](metric=self._config["metric"])
+            return self._teleprompters[strategy](
+                metric=self._config["metric"], num_threads=num_threads
+            )
         if strategy == "bootstrap_random":
             return self._teleprompters[strategy](
                 metric=self._config["metric"],
                 max_bootstrapped_demos=self._config["max_bootstrapped_demos"],
                 max_labeled_demos=self._config["max_labeled_demos"],
+                num_threads=num_threads,
             )
         if strategy == "simba":
             return self._teleprompters[strategy](
                 metric=self._config["metric"],
                 max_bootstrapped_demos=self._config["max_demos"],
+                num_threads=num_threads,
             )
         return self._teleprompters[strategy](metric=self._config["metric"])
 
@@ -3,14 +3,28 @@
 Provides pipeline construction and execution.
 """
 
+import contextvars
+import operator
 import threading
-from typing import Any, List, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Tuple, Dict
 import dspy
 from .exceptions import PipelineError, ValidationError
+from .settings import settings as global_settings
+
+
+# Registered steps of the current thread/task. Each context builds its own
+# pipeline, so concurrent workers never see each other's steps. The value is an
+# immutable tuple that is replaced on every change.
+_steps_var = contextvars.ContextVar("simpledspy_pipeline_steps", default=())
 
 
 class PipelineManager:
-    """Manages DSPy pipeline construction and execution"""
+    """Manages DSPy pipeline construction and execution
+
+    The manager is a singleton, but the registered steps are local to the
+    current thread or asyncio task.
+    """
 
     _instance = None
     _lock = threading.Lock()
@@ -19,13 +33,12 @@ class PipelineManager:
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super().__new__(cls)
-                cls._instance._steps = []
         return cls._instance
 
-    def __init__(self) -> None:
-        """Initialize pipeline manager instance"""
-        if not hasattr(self, "_steps"):
-            self._steps = []
+    @property
+    def _steps(self) -> Tuple[Tuple[List[str], List[str], Any], ...]:
+        """Steps registered in the current context"""
+        return _steps_var.get()
 
     def register_step(self, inputs: List[str], outputs: List[str], module: Any) -> None:
         """Register a pipeline step with input/output specifications
@@ -42,17 +55,17 @@ class PipelineManager:
         if not hasattr(module, '__call__'):
             raise ValidationError("module must be callable")
         
-        self._steps.append((inputs, outputs, module))
+        _steps_var.set(_steps_var.get() + ((inputs, outputs, module),))
 
     def assemble_pipeline(self) -> "Pipeline":
         """Assemble the pipeline from registered steps"""
         if not self._steps:
             raise PipelineError("No steps in pipeline")
-        return Pipeline(self._steps)
+        return Pipeline(list(self._steps))
 
     def reset(self) -> None:
         """Reset the pipeline steps and any module state"""
-        self._steps = []
+        _steps_var.set(())
 
 
 class Pipeline(dspy.Module):
@@ -63,35 +76,123 @@ class Pipeline(dspy.Module):
         self.step_tuples = steps  # store the full step tuples
         for i, (_, _, module) in enumerate(steps):
             setattr(self, f"step_{i}", module)
+        self.levels = self._build_levels(steps)
+        # Getters are built once so a forward pass only makes C-level lookups
+        self._input_getters = [
+            self._tuple_getter(operator.itemgetter, input_names)
+            for input_names, _, _ in steps
+        ]
+        self._output_getters = [
+            self._tuple_getter(operator.attrgetter, output_names)
+            for _, output_names, _ in steps
+        ]
+        self._output_key_getters = [
+            self._tuple_getter(operator.itemgetter, output_names)
+            for _, output_names, _ in steps
+        ]
+
+    @staticmethod
+    def _tuple_getter(
+        getter_type: Callable[..., Callable], names: List[str]
+    ) -> Callable[[Any], Tuple[Any, ...]]:
+        """Build a getter that returns a tuple of the named values"""
+        if not names:
+            return lambda obj: ()
+        if len(names) == 1:
+            get_one = getter_type(names[0])
+            return lambda obj: (get_one(obj),)
+        return getter_type(*names)
+
+    @staticmethod
+    def _build_levels(
+        steps: List[Tuple[List[str], List[str], Any]],
+    ) -> List[List[int]]:
+        """Group step indices into levels whose steps are independent
+
+        A step depends on an earlier step if it reads one of its outputs,
+        writes one of the same outputs, or overwrites one of its inputs.
+        Running the levels in order therefore sees the same data as running
+        the steps one by one.
+        """
+        step_levels = []
+        levels = []
+        for i, (input_names, output_names, _) in enumerate(steps):
+            level = 0
+            for j in range(i):
+                earlier_inputs, earlier_outputs, _ = steps[j]
+                if (
+                    set(input_names) & set(earlier_outputs)
+                    or set(output_names) & set(earlier_outputs)
+                    or set(output_names) & set(earlier_inputs)
+                ):
+                    level = max(level, step_levels[j] + 1)
+            step_levels.append(level)
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(i)
+        return levels
+
+    def _run_step(self, i: int, step_inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a single step and collect its outputs"""
+        _, output_names, _ = self.step_tuples[i]
+        module = getattr(self, f"step_{i}")
+        prediction = module(**step_inputs)
+
+        # A Prediction's fields are pulled from one dict copy rather than
+        # through its __getattr__ once per output
+        if isinstance(prediction, dspy.Prediction):
+            source, getter = prediction.toDict(), self._output_key_getters[i]
+        else:
+            source, getter = prediction, self._output_getters[i]
+        try:
+            values = getter(source)
+        except (AttributeError, KeyError):
+            missing = next(n for n in output_names if not hasattr(prediction, n))
+            raise ValueError(
+                f"Pipeline Step {i}: Output field '{missing}' not found"
+            ) from None
+        return dict(zip(output_names, values))
 
     def forward(self, **inputs: Dict[str, Any]) -> dspy.Prediction:
-        """Execute the pipeline steps sequentially"""
+        """Execute the pipeline, running independent steps concurrently"""
         data = inputs.copy()
-        all_outputs = {}
+        step_outputs = {}
 
-        for i, (input_names, output_names, _) in enumerate(self.step_tuples):
+        for level in self.levels:
             # Prepare step inputs
-            step_inputs = {}
-            for name in input_names:
-                if name in data:
-                    step_inputs[name] = data[name]
-                else:
-                    raise ValueError(f"Pipeline Step {i}: Missing input '{name}'")
-
-            # Execute step
-            module = getattr(self, f"step_{i}")
-            prediction = module(**step_inputs)
-
-            # Collect outputs
-            for name in output_names:
-                if hasattr(prediction, name):
-                    value = getattr(prediction, name)
-                else:
+            level_inputs = []
+            for i in level:
+                input_names = self.step_tuples[i][0]
+                try:
+                    values = self._input_getters[i](data)
+                except KeyError as e:
                     raise ValueError(
-                        f"Pipeline Step {i}: Output field '{name}' not found"
-                    )
-
-                data[name] = value
-                all_outputs[name] = value
+                        f"Pipeline Step {i}: Missing input '{e.args[0]}'"
+                    ) from None
+                level_inputs.append(dict(zip(input_names, values)))
+
+            # Execute steps
+            if len(level) == 1:
+                results = [self._run_step(level[0], level_inputs[0])]
+            else:
+                max_workers = min(len(level), global_settings.num_threads)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            contextvars.copy_context().run,
+                            self._run_step,
+                            i,
+                            step_inputs,
+                        )
+                        for i, step_inputs in zip(level, level_inputs)
+                    ]
+                    results = [future.result() for future in futures]
+
+            for i, outputs in zip(level, results):
+                data.update(outputs)
+                step_outputs[i] = outputs
 
+        all_outputs = {}
+        for i in range(len(self.step_tuples)):
+            all_outputs.update(step_outputs[i])
         return dspy.Prediction(**all_outputs)
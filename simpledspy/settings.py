@@ -10,14 +10,34 @@ class Settings:  # pylint: disable=too-few-public-methods
         self.max_tokens = None
         self.logging_enabled = False
         self.log_dir = ".simpledspy"  # Default logging directory
+        # Module call records buffered before they are written (1 writes each)
+        self.log_buffer_size = 1
         self.default_lm = None  # Default LM for module_caller
         self.evaluator_lm = None  # Default LM for evaluator
+        # Base URL of an OpenAI-compatible server (e.g. a local vLLM instance)
+        self.api_base = None
+        # Reuse DSPy's on-disk response cache for identical requests
+        self.cache = True
+        # Infer input/output names and types from the calling code; when off,
+        # names default to arg0, arg1, ... and output unless given explicitly
+        self.introspection_enabled = True
         # Rate limiting settings
         self.rate_limit_calls = 100  # Max calls per window
         self.rate_limit_window = 60  # Window size in seconds
         # Retry settings
         self.retry_attempts = 3  # Max retry attempts
         self.retry_delay = 1.0  # Initial retry delay in seconds
+        # Concurrency settings
+        self.num_threads = 8  # Max threads for concurrent LM calls
+
+    def lm_kwargs(self):
+        """Extra keyword arguments for LMs created from a model name"""
+        kwargs = {}
+        if self.api_base:
+            kwargs["api_base"] = self.api_base
+        if not self.cache:
+            kwargs["cache"] = False
+        return kwargs
 
     def __str__(self):
         return (
@@ -0,0 +1,10 @@
+"""Shared pytest fixtures"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_log_dir(tmp_path, monkeypatch):
+    """Run each test in its own directory so default logs (.simpledspy/) do not
+    end up in the repository"""
+    monkeypatch.chdir(tmp_path)
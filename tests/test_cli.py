@@ -1,12 +1,16 @@
 """Tests for the CLI interface"""
 
+import json
 import os
+import subprocess
 import sys
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from simpledspy.cli import main
+from simpledspy.cli import _dumps, main
 
 
 def test_cli_direct_input(capsys):
@@ -93,6 +97,21 @@ def test_cli_help(capsys):
         assert "--max-demos" in captured.out
 
 
+def test_cli_import_is_lazy():
+    """Test that loading the CLI (e.g. for --help) does not import dspy"""
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import sys, simpledspy.cli; print('dspy' in sys.modules)",
+        ],
+        cwd=root,
+        text=True,
+    )
+    assert output.strip() == "False"
+
+
 def test_cli_optimization(capsys):
     """Test CLI optimization flag"""
     # Mock the arguments
@@ -125,6 +144,26 @@ def test_cli_optimization(capsys):
             assert "Optimized Hello" in captured.out
 
 
+def test_cli_optimization_num_threads():
+    """Test that --num-threads is forwarded to the optimizer"""
+    argv = ["cli.py", "Hello", "--optimize", "--num-threads", "16"]
+    with patch("sys.argv", argv), patch(
+        "simpledspy.cli.ModuleFactory"
+    ) as mock_factory_class, patch(
+        "simpledspy.optimization_manager.OptimizationManager"
+    ) as mock_opt_manager_class:
+        mock_module = MagicMock(return_value=MagicMock(output="Hi"))
+        mock_factory_class.return_value.create_module.return_value = mock_module
+        mock_manager = mock_opt_manager_class.return_value
+        mock_manager.optimize.return_value = mock_module
+
+        main()
+
+        mock_manager.configure.assert_called_once_with(
+            strategy="bootstrap_few_shot", max_bootstrapped_demos=4, num_threads=16
+        )
+
+
 # Helpers for pipeline test
 class _MockPrediction:  # pylint: disable=too-few-public-methods
     """Mock prediction object for pipeline testing."""
@@ -195,3 +234,110 @@ def test_cli_pipeline(capsys):
         # Verify pipeline was created and executed
         mock_manager.register_step.assert_called()
         mock_manager.assemble_pipeline.assert_called_once()
+        # Only the two step modules are built
+        assert mock_factory.create_module.call_count == 2
+
+
+def test_cli_batch_file(capsys, tmp_path):
+    """Test CLI batch mode prints one result per row in input order"""
+    batch_file = tmp_path / "batch.jsonl"
+    batch_file.write_text('["first", "a"]\n\n["second", "b"]\n["third", "c"]\n')
+
+    argv = ["cli.py", "--batch-file", str(batch_file), "--num-threads", "3"]
+    with patch("sys.argv", argv), patch(
+        "simpledspy.cli.ModuleFactory"
+    ) as mock_factory_class:
+        mock_factory = mock_factory_class.return_value
+        mock_module = MagicMock()
+        mock_module.side_effect = lambda **kwargs: MagicMock(
+            output=f"{kwargs['input_1']}-{kwargs['input_2']}"
+        )
+        mock_factory.create_module.return_value = mock_module
+
+        main()
+
+        mock_factory.create_module.assert_called_once_with(
+            inputs=["input_1", "input_2"], outputs=["output"], description=None
+        )
+        captured = capsys.readouterr()
+        assert captured.out.split() == ["first-a", "second-b", "third-c"]
+
+
+def test_cli_batch_file_mismatched_rows(capsys, tmp_path):
+    """Test CLI batch mode rejects rows with differing input counts"""
+    batch_file = tmp_path / "batch.jsonl"
+    batch_file.write_text('["one", "two"]\n"single"\n')
+
+    with patch("sys.argv", ["cli.py", "--batch-file", str(batch_file)]):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "same number of inputs" in captured.out
+
+
+def test_cli_batch_stdin_chunks(capsys):
+    """Test CLI batch mode streams stdin rows in chunks"""
+    lines = ['"one"\n', '"two"\n', '"three"\n']
+    argv = ["cli.py", "--batch-file", "-", "--batch-size", "2"]
+    with patch("sys.argv", argv), patch("sys.stdin", lines), patch(
+        "simpledspy.cli.ModuleFactory"
+    ) as mock_factory_class:
+        mock_factory = mock_factory_class.return_value
+        mock_module = MagicMock()
+        mock_module.side_effect = lambda **kwargs: MagicMock(
+            output=kwargs["input_1"].upper()
+        )
+        mock_factory.create_module.return_value = mock_module
+
+        main()
+
+        captured = capsys.readouterr()
+        assert captured.out.split() == ["ONE", "TWO", "THREE"]
+        assert mock_module.call_count == 3
+
+
+def test_cli_prediction_output(capsys):
+    """Test CLI output taken from a Prediction-like result"""
+
+    class _DictResult:  # pylint: disable=too-few-public-methods
+        """Result exposing its fields only through toDict"""
+
+        def toDict(self):  # pylint: disable=invalid-name
+            """Return the result fields."""
+            return {"output": "from dict", "reasoning": "unused"}
+
+    with patch("sys.argv", ["cli.py", "Hello", "--json"]), patch(
+        "simpledspy.cli.ModuleFactory"
+    ) as mock_factory_class:
+        mock_module = MagicMock(return_value=_DictResult())
+        mock_factory_class.return_value.create_module.return_value = mock_module
+
+        main()
+
+        captured = capsys.readouterr()
+        assert json.loads(captured.out) == {"output": "from dict"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_cli_json_output_with_and_without_orjson(capsys, use_orjson):
+    """Test --json output is the same with or without orjson"""
+    orjson = pytest.importorskip("orjson") if use_orjson else None
+    with patch("sys.argv", ["cli.py", "Hi", "--json"]), patch(
+        "simpledspy.cli.orjson", orjson
+    ), patch("simpledspy.cli.ModuleFactory") as mock_factory_class:
+        mock_module = MagicMock(return_value=MagicMock(output="Grüße"))
+        mock_factory_class.return_value.create_module.return_value = mock_module
+
+        main()
+
+        captured = capsys.readouterr()
+        assert json.loads(captured.out) == {"output": "Grüße"}
+
+
+def test_dumps_falls_back_when_orjson_rejects():
+    """Test values orjson cannot serialize go through json.dumps"""
+    pytest.importorskip("orjson")
+    obj = {"output": 2**70, 1: "non-str key"}
+
+    assert _dumps(obj) == json.dumps(obj)
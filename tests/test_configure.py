@@ -1,6 +1,9 @@
 """Tests for configure.py"""
 
+from unittest.mock import patch
+
 from simpledspy import configure
+from simpledspy.module_caller import BaseCaller, Predict
 from simpledspy.settings import settings as global_settings
 
 
@@ -25,7 +28,24 @@ def test_configure_settings():
         assert global_settings.lm == "test_lm"  # unchanged
     finally:
         # Restore original settings
-        global_settings.lm = original_lm
+        configure(lm=original_lm)
         global_settings.temperature = original_temp
         if hasattr(global_settings, "max_tokens"):
             delattr(global_settings, "max_tokens")
+
+
+def test_configure_rebuilds_caller_lm():
+    """Test configure rebuilds the LM of existing callers"""
+    with patch("simpledspy.module_caller.dspy") as mock_dspy, patch.dict(
+        BaseCaller._instances, clear=True
+    ), patch.object(global_settings, "default_lm", None), patch.object(
+        global_settings, "api_base", None
+    ):
+        caller = Predict()
+        configure(default_lm="openai/gpt-4o", api_base="http://localhost:8000/v1")
+
+        mock_dspy.LM.assert_called_with(
+            model="openai/gpt-4o", api_base="http://localhost:8000/v1"
+        )
+        assert caller.lm is mock_dspy.LM.return_value
+        mock_dspy.configure.assert_called_with(lm=caller.lm)
@@ -1,12 +1,17 @@
 """Tests for evaluator.py"""
 
+import gc
 import os
 import sys
-from unittest.mock import patch
+import threading
+import time
+import weakref
+from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from simpledspy.evaluator import Evaluator
+from simpledspy.evaluator import Evaluator, _extract_score
+from simpledspy.settings import settings as global_settings
 
 
 @patch("dspy.LM")
@@ -17,7 +22,12 @@ def test_evaluator_init(mock_lm):
     )
 
     assert evaluator.evaluation_instruction == "Test instruction"
-    assert mock_lm.called
+    assert not mock_lm.called
+
+    # The LM is created on first access and reused afterwards
+    assert evaluator.evaluator_lm is mock_lm.return_value
+    assert evaluator.evaluator_lm is mock_lm.return_value
+    assert mock_lm.call_count == 1
 
 
 def test_evaluate_no_instruction():
@@ -72,3 +82,236 @@ def test_log_with_evaluation(mock_logger, mock_lm):
     assert log_data["outputs"] == {"out": "test"}
     assert log_data["description"] == "test_desc"
     assert log_data["score"] == 9
+
+
+def test_extract_score_prefers_labelled_score():
+    """Test that labelled scores win over earlier bare numbers"""
+    assert _extract_score("Checked 3 facts, 42 words. Score: 7") == 7
+    assert _extract_score("Out of 100 points: 8/10") == 8
+    assert _extract_score("0 issues, 12 lines, so 9") == 9
+    assert _extract_score("no number here") is None
+
+
+def test_extract_score_after_reasoning():
+    """Test that the final answer wins over numbers in a reasoning preamble"""
+    response = "A score of 4 seemed fair at first, but step 2 holds. Score: 8"
+    assert _extract_score(response) == 8
+    assert _extract_score("Criteria 1 and 3 are met, so I give it a 7") == 7
+
+
+def test_extract_score_out_of_ten():
+    """Test that the denominator of a fraction is not taken as the score"""
+    assert _extract_score("I would rate this 7 out of 10.") == 7
+    assert _extract_score("Two issues, so 6 out of 10") == 6
+    assert _extract_score("Solid work: 8 / 10") == 8
+
+
+@patch("dspy.LM")
+def test_evaluate_multiple_instructions(mock_lm):
+    """Test evaluate() averages the scores of several instructions"""
+    scores = {"Check facts": ["Score: 8"], "Check style": ["6/10"], "Skip": []}
+    mock_lm.return_value.side_effect = lambda prompt: scores[prompt.split("\n")[0]]
+
+    evaluator = Evaluator("Unused instruction")
+    score = evaluator.evaluate(
+        {"q": "x"}, {"a": "y"}, ["Check facts", "Check style", "Skip"]
+    )
+    assert score == 7
+
+
+@patch("dspy.LM")
+def test_evaluate_caches_prompt_scores(mock_lm):
+    """Test that an identical evaluation prompt is only sent once"""
+    mock_instance = mock_lm.return_value
+    mock_instance.return_value = ["Score: 8"]
+
+    evaluator = Evaluator("Test instruction")
+    assert evaluator.evaluate({"q": "x"}, {"a": "y"}) == 8
+    assert evaluator.evaluate({"q": "x"}, {"a": "y"}) == 8
+    assert mock_instance.call_count == 1
+
+    evaluator.evaluate({"q": "x"}, {"a": "z"})
+    assert mock_instance.call_count == 2
+
+    # Outputs that differ only in whitespace are scored separately
+    evaluator.evaluate({"q": "x"}, {"a": "One.  Two."})
+    evaluator.evaluate({"q": "x"}, {"a": "One. Two."})
+    assert mock_instance.call_count == 4
+
+
+def test_extract_score_number_types():
+    """Test that whole scores parse as int and decimal scores as float"""
+    assert isinstance(_extract_score("Score: 8"), int)
+    assert _extract_score("Rating: 7.5") == 7.5
+    assert _extract_score("Score: 0, so 10") == 10
+
+
+@patch("simpledspy.evaluator.dspy")
+def test_evaluator_skips_redundant_configure(mock_dspy):
+    """Test that an already configured LM is not configured again"""
+    lm = MagicMock()
+    original_lm = global_settings.lm
+    global_settings.lm = lm
+    try:
+        mock_dspy.settings.lm = lm
+        assert Evaluator("Test instruction").evaluator_lm is lm
+        mock_dspy.configure.assert_not_called()
+
+        mock_dspy.settings.lm = MagicMock()
+        assert Evaluator("Test instruction").evaluator_lm is lm
+        mock_dspy.configure.assert_called_once_with(lm=lm)
+    finally:
+        global_settings.lm = original_lm
+
+
+@patch("dspy.LM")
+@patch("simpledspy.evaluator.Logger")
+def test_log_with_evaluation_batches_writes(mock_logger, mock_lm):
+    """Test that buffered evaluations are written together"""
+    mock_lm.return_value.return_value = ["7"]
+
+    evaluator = Evaluator("Test instruction", log_batch_size=2)
+    evaluator.log_with_evaluation(module="m", inputs={"in": 1}, outputs={"out": 1})
+    mock_logger.return_value.log_many.assert_not_called()
+
+    evaluator.log_with_evaluation(module="m", inputs={"in": 2}, outputs={"out": 2})
+    (records,), _ = mock_logger.return_value.log_many.call_args
+    assert [record["inputs"] for record in records] == [{"in": 1}, {"in": 2}]
+
+    evaluator.log_with_evaluation(module="m", inputs={"in": 3}, outputs={"out": 3})
+    evaluator.flush()
+    assert mock_logger.return_value.log_many.call_count == 2
+    mock_logger.return_value.log.assert_not_called()
+
+
+@patch("dspy.LM")
+def test_evaluate_prompt_uses_json(mock_lm):
+    """Test that inputs and outputs are rendered as JSON in the prompt"""
+    mock_instance = mock_lm.return_value
+    mock_instance.return_value = ["8"]
+
+    evaluator = Evaluator("Rate it")
+    evaluator.evaluate({"question": "Größe?"}, {"answer": object()})
+
+    (prompt,), _ = mock_instance.call_args
+    assert prompt.startswith('Rate it\n\nInputs: {"question": "Größe?"}\nOutputs: ')
+    assert '{"answer": "<object object at' in prompt
+
+
+@patch("dspy.LM")
+@patch("simpledspy.evaluator.ThreadPoolExecutor")
+def test_evaluate_sequential_with_one_worker(mock_executor, mock_lm):
+    """Test that max_workers=1 scores instructions without a thread pool"""
+    mock_instance = mock_lm.return_value
+    mock_instance.side_effect = [["4"], ["8"]]
+
+    evaluator = Evaluator(max_workers=1)
+    assert evaluator.evaluate({}, {}, ["First", "Second"]) == 6
+    mock_executor.assert_not_called()
+    prompts = [call.args[0] for call in mock_instance.call_args_list]
+    assert [prompt.split("\n")[0] for prompt in prompts] == ["First", "Second"]
+
+
+@patch("dspy.LM")
+def test_evaluate_batch(mock_lm):
+    """Test evaluate_batch() returns one score per pair in order"""
+    mock_lm.return_value.side_effect = lambda prompt: (
+        ["9"] if '"good"' in prompt else ["2"]
+    )
+
+    evaluator = Evaluator("Rate it")
+    pairs = [({"q": 1}, {"a": "good"}), ({"q": 2}, {"a": "bad"})] * 3
+    assert evaluator.evaluate_batch(pairs) == [9, 2] * 3
+    assert evaluator.evaluate_batch([]) == []
+
+
+@patch("dspy.LM")
+@patch("simpledspy.retry.time.sleep")
+def test_evaluate_retries_failed_lm_call(mock_sleep, mock_lm):
+    """Test that a transient LM error is retried instead of failing the score"""
+    mock_instance = mock_lm.return_value
+    mock_instance.side_effect = [RuntimeError("rate limited"), ["Score: 8"]]
+
+    evaluator = Evaluator("Test instruction")
+    assert evaluator.evaluate({"q": "x"}, {"a": "y"}) == 8
+    assert mock_instance.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+@patch("dspy.LM")
+@patch("simpledspy.evaluator.Logger")
+def test_log_with_evaluation_without_instruction(mock_logger, mock_lm):
+    """Test that evaluations without instructions are logged without scoring"""
+    evaluator = Evaluator()
+    assert not evaluator.is_enabled
+    with patch.object(evaluator, "evaluate") as mock_evaluate:
+        evaluator.log_with_evaluation(module="m", inputs={"in": 1}, outputs={})
+        mock_evaluate.assert_not_called()
+
+    (log_data,), _ = mock_logger.return_value.log.call_args
+    assert log_data["score"] == 0.0
+    assert log_data["instructions"] == []
+    mock_lm.return_value.assert_not_called()
+
+
+@patch("simpledspy.evaluator.dspy")
+def test_evaluator_lm_configured_in_calling_thread(mock_dspy):
+    """Test that the lazily created LM is never configured from a worker thread"""
+    configure_threads = []
+    mock_dspy.configure.side_effect = lambda **_: configure_threads.append(
+        threading.get_ident()
+    )
+    mock_dspy.LM.return_value.return_value = ["Score: 6"]
+    original_lm = global_settings.lm
+    global_settings.lm = None
+    try:
+        evaluator = Evaluator("Rate it", max_workers=4)
+        assert evaluator.evaluate({}, {"a": 1}, ["First", "Second"]) == 6
+        assert Evaluator("Rate it", max_workers=4).evaluate_batch(
+            [({}, {"a": 1}), ({}, {"a": 2})]
+        ) == [6, 6]
+    finally:
+        global_settings.lm = original_lm
+    assert configure_threads == [threading.get_ident()] * 2
+
+
+@patch("dspy.LM")
+def test_evaluate_batch_bounds_concurrency(mock_lm):
+    """Test that evaluate_batch() keeps at most max_workers LM calls in flight"""
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def call(prompt):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return ["8" if prompt.startswith("A") else "4"]
+
+    mock_lm.return_value.side_effect = call
+    evaluator = Evaluator(max_workers=2)
+    pairs = [({"q": i}, {"a": i}) for i in range(4)]
+    assert evaluator.evaluate_batch(pairs, ["A", "B", "C"]) == [16 / 3] * 4
+    assert mock_lm.return_value.call_count == 12
+    assert peak[0] <= 2
+
+
+@patch("dspy.LM")
+@patch("simpledspy.evaluator.Logger")
+def test_buffered_evaluator_flushes_when_collected(mock_logger, mock_lm):
+    """Test that a dropped evaluator writes its buffer and is not kept alive"""
+    mock_lm.return_value.return_value = ["7"]
+
+    evaluator = Evaluator("Test instruction", log_batch_size=10)
+    evaluator.log_with_evaluation(module="m", inputs={"in": 1}, outputs={"out": 1})
+    mock_logger.return_value.log_many.assert_not_called()
+
+    reference = weakref.ref(evaluator)
+    del evaluator
+    gc.collect()
+    assert reference() is None
+    (records,), _ = mock_logger.return_value.log_many.call_args
+    assert [record["inputs"] for record in records] == [{"in": 1}]
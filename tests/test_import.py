@@ -1,5 +1,7 @@
 """Tests for import warnings"""
 
+import os
+import subprocess
 import unittest
 import warnings
 import sys
@@ -85,6 +87,20 @@ class TestImport(unittest.TestCase):
             else:
                 del sys.modules["simpledspy"]
 
+    def test_import_is_lazy(self):
+        """Test that importing the package does not load dspy"""
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, simpledspy; print('dspy' in sys.modules)",
+            ],
+            cwd=root,
+            text=True,
+        )
+        self.assertEqual(output.strip(), "False")
+
 
 if __name__ == "__main__":
     unittest.main()
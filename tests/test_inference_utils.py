@@ -4,7 +4,11 @@ import pytest
 import ast
 import inspect
 from unittest.mock import Mock, patch
-from simpledspy.inference_utils import InferenceUtils
+from simpledspy.inference_utils import (
+    InferenceUtils,
+    _call_arg_names,
+    _line_output_names,
+)
 from simpledspy.exceptions import SecurityError
 
 
@@ -28,6 +32,15 @@ class TestASTDepthCalculation:
         depth = InferenceUtils.get_ast_depth("not an AST", 5)
         assert depth == 5
 
+    def test_get_ast_depth_deep_tree(self):
+        """Test that very deep trees neither recurse nor walk past the limit"""
+        node = ast.Name(id="x")
+        for _ in range(5000):
+            node = ast.UnaryOp(op=ast.Not(), operand=node)
+        # The innermost UnaryOp is at depth 4999, its Name operand at 5000
+        assert InferenceUtils.get_ast_depth(node) == 5000
+        assert InferenceUtils.get_ast_depth(node, limit=10) == 11
+
 
 class TestSafeParseAST:
     """Test safe AST parsing with security checks"""
@@ -63,6 +76,10 @@ class TestSafeParseAST:
 
 class TestInferOutputNames:
     """Test output name inference"""
+
+    def setup_method(self):
+        """Forget call sites read by earlier tests"""
+        _line_output_names.cache_clear()
     
     def test_infer_output_names_no_frame(self):
         """Test with no frame"""
@@ -74,8 +91,8 @@ class TestInferOutputNames:
         mock_frame = Mock()
         mock_frame.code_context = ["result = predict('test')"]
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = ["result = predict('test')"]
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "result = predict('test')"
             result = InferenceUtils.infer_output_names(mock_frame)
             assert result == ["result"]
     
@@ -83,8 +100,8 @@ class TestInferOutputNames:
         """Test tuple assignment"""
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = ["name1, name2 = predict('test')"]
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "name1, name2 = predict('test')"
             result = InferenceUtils.infer_output_names(mock_frame)
             assert result == ["name1", "name2"]
     
@@ -92,8 +109,8 @@ class TestInferOutputNames:
         """Test standalone call without assignment"""
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = ["predict('test')"]
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "predict('test')"
             result = InferenceUtils.infer_output_names(mock_frame)
             assert result == ["output"]
     
@@ -103,11 +120,11 @@ class TestInferOutputNames:
         mock_frame.f_back = Mock()
         mock_frame.f_back.f_back = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
+        with patch('linecache.getline') as mock_info:
             # First frame doesn't have predict
             mock_info.side_effect = [
-                Mock(code_context=["some_other_code()"]),
-                Mock(code_context=["result = chain_of_thought('test')"])
+                "some_other_code()",
+                "result = chain_of_thought('test')"
             ]
             
             result = InferenceUtils.infer_output_names(mock_frame)
@@ -117,22 +134,55 @@ class TestInferOutputNames:
         """Test with no code context"""
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = None
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = ""
             result = InferenceUtils.infer_output_names(mock_frame)
             assert result == ["output"]
     
+    def test_infer_output_names_assignment_forms(self):
+        """Test annotated, parenthesized and keyword-argument call lines"""
+        cases = {
+            "(name1, name2) = predict('test')": ["name1", "name2"],
+            "answer: str = predict('test')": ["answer"],
+            "self.summary = predict(text)": ["summary"],
+            "predict(text, temperature=0.5)": ["output"],
+            "if label == predict(text):": ["output"],
+        }
+        for line, expected in cases.items():
+            with patch('linecache.getline', return_value=line):
+                assert InferenceUtils.infer_output_names(Mock()) == expected
+
+    def test_infer_output_names_cached_per_call_site(self):
+        """Test that a call site's line is read and split only once"""
+        mock_frame = Mock()
+
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "label, score = predict('test')"
+            for _ in range(3):
+                result = InferenceUtils.infer_output_names(mock_frame)
+                assert result == ["label", "score"]
+            assert mock_info.call_count == 1
+
+            # A different line in the same code is a new call site
+            mock_frame.f_lineno = 42
+            mock_info.return_value = "answer = predict('test')"
+            assert InferenceUtils.infer_output_names(mock_frame) == ["answer"]
+
     def test_infer_output_names_exception_handling(self):
         """Test exception handling"""
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo', side_effect=AttributeError):
+        with patch('linecache.getline', side_effect=AttributeError):
             result = InferenceUtils.infer_output_names(mock_frame)
             assert result == ["output"]
 
 
 class TestInferInputNames:
     """Test input name inference"""
+
+    def setup_method(self):
+        """Forget call lines parsed by earlier tests"""
+        _call_arg_names.cache_clear()
     
     def test_infer_input_names_no_frame(self):
         """Test with no frame"""
@@ -145,8 +195,8 @@ class TestInferInputNames:
         args = ("value1", "value2")
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = ["predict(var1, var2)"]
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "predict(var1, var2)"
             
             with patch.object(InferenceUtils, 'safe_parse_ast') as mock_parse:
                 # Create AST with variable names
@@ -166,8 +216,8 @@ class TestInferInputNames:
         args = ("value",)
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = ["predict(self.data)"]
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "predict(self.data)"
             
             with patch.object(InferenceUtils, 'safe_parse_ast') as mock_parse:
                 # Create AST with self.attribute
@@ -190,8 +240,8 @@ class TestInferInputNames:
         args = ("value1", "value2", "value3")
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = ["predict(var1, 'literal', func())"]
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "predict(var1, 'literal', func())"
             
             with patch.object(InferenceUtils, 'safe_parse_ast') as mock_parse:
                 # Create AST with mixed types
@@ -215,8 +265,8 @@ class TestInferInputNames:
         args = ("value1", "value2", "value3")
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = ["predict(args, kwargs, self)"]
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "predict(args, kwargs, self)"
             
             with patch.object(InferenceUtils, 'safe_parse_ast') as mock_parse:
                 # Create AST with reserved words
@@ -240,8 +290,8 @@ class TestInferInputNames:
         args = ("value1", "value2")
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = ["x = 1"]
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "x = 1"
             
             with patch.object(InferenceUtils, 'safe_parse_ast') as mock_parse:
                 # Create AST without call node
@@ -256,8 +306,8 @@ class TestInferInputNames:
         args = ("value",)
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = None
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = ""
             result = InferenceUtils.infer_input_names(args, mock_frame)
             assert result == ["arg0"]
     
@@ -266,20 +316,51 @@ class TestInferInputNames:
         args = ("value1", "value2")
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo') as mock_info:
-            mock_info.return_value.code_context = ["predict(var1, var2)"]
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "predict(var1, f(var2))"
             
             # When safe_parse_ast raises ValueError (which is caught), it falls back to arg0, arg1
             with patch.object(InferenceUtils, 'safe_parse_ast', side_effect=ValueError("Test error")):
                 result = InferenceUtils.infer_input_names(args, mock_frame)
                 assert result == ["arg0", "arg1"]
     
+    def test_infer_input_names_parses_call_line_once(self):
+        """Test that a repeated call site is only parsed once"""
+        args = ("value1", "value2")
+        mock_frame = Mock()
+
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = "predict(var1, var2=f(x))"
+
+            with patch.object(
+                InferenceUtils, 'safe_parse_ast', wraps=InferenceUtils.safe_parse_ast
+            ) as mock_parse:
+                for _ in range(3):
+                    result = InferenceUtils.infer_input_names(args, mock_frame)
+                    assert result == ["var1"]
+                assert mock_parse.call_count == 1
+
+    def test_infer_input_names_simple_call_skips_parser(self):
+        """Test that plain name arguments are read without ast.parse"""
+        args = ("value1", "value2", "value3")
+        mock_frame = Mock()
+
+        with patch('linecache.getline') as mock_info:
+            mock_info.return_value = (
+                "a, b = chain_of_thought(text, self.context, kwargs)"
+            )
+
+            with patch.object(InferenceUtils, 'safe_parse_ast') as mock_parse:
+                result = InferenceUtils.infer_input_names(args, mock_frame)
+                assert result == ["text", "context", "arg2"]
+                mock_parse.assert_not_called()
+
     def test_infer_input_names_exception_handling(self):
         """Test general exception handling"""
         args = ("value",)
         mock_frame = Mock()
         
-        with patch('inspect.getframeinfo', side_effect=AttributeError):
+        with patch('linecache.getline', side_effect=AttributeError):
             result = InferenceUtils.infer_input_names(args, mock_frame)
             assert result == ["arg0"]
 
@@ -421,6 +502,49 @@ class TestGetTypeHintsFromSignature:
         assert isinstance(input_types, dict)
         assert isinstance(output_types, dict)
     
+    def test_get_type_hints_signature_cached(self):
+        """Test that signatures are inspected once per function"""
+        def test_func(x: int) -> str:
+            return str(x)
+
+        mock_frame = Mock()
+        mock_frame.f_code.co_name = "test_func"
+        mock_frame.f_locals = {"test_func": test_func}
+        mock_frame.f_globals = {}
+        mock_frame.f_back = None
+
+        with patch('inspect.signature', wraps=inspect.signature) as mock_signature:
+            for _ in range(3):
+                input_types, output_types = (
+                    InferenceUtils.get_type_hints_from_signature(
+                        mock_frame, ["x"], ["output"]
+                    )
+                )
+            assert mock_signature.call_count == 1
+
+        assert input_types == {"x": int}
+        assert output_types == {"output": str}
+
+    def test_get_type_hints_cached_per_input_names(self):
+        """Test that cached annotations serve calls with different inputs"""
+        def test_func(x: int, y: str, z) -> str:
+            return str(x) + y + z
+
+        mock_frame = Mock()
+        mock_frame.f_code.co_name = "test_func"
+        mock_frame.f_locals = {"test_func": test_func}
+        mock_frame.f_globals = {}
+        mock_frame.f_back = None
+
+        first, _ = InferenceUtils.get_type_hints_from_signature(
+            mock_frame, ["y", "z"], ["output"]
+        )
+        second, _ = InferenceUtils.get_type_hints_from_signature(
+            mock_frame, ["x"], ["output"]
+        )
+        assert first == {"y": str}
+        assert second == {"x": int}
+
     def test_get_type_hints_exception_handling(self):
         """Test general exception handling"""
         mock_frame = Mock()
@@ -3,19 +3,30 @@
 import json
 import os
 import re
+import shutil
 import sys
 import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from simpledspy.logger import Logger
+from simpledspy.logger import Logger, _utc_timestamp
 
 
-def test_logger_init_creates_file():
-    """Test that Logger creates the log file on init"""
+def test_logger_creates_files_on_first_write():
+    """Test that Logger creates its files on the first write, not on init"""
     with tempfile.TemporaryDirectory() as tmpdir:
         module_name = "test_module"
         logger = Logger(module_name, base_dir=tmpdir)
+        assert not os.path.exists(logger.base_dir)
+        assert logger.load_training_data() == []
+        assert not os.path.exists(logger.base_dir)
+
+        logger.log({"n": 1})
+        logger.log_to_section({"n": 2}, section="training")
         assert os.path.exists(logger.logged_file)
         assert os.path.exists(logger.training_file)
 
@@ -75,6 +86,7 @@ def test_logger_handles_invalid_data():
     with tempfile.TemporaryDirectory() as tmpdir:
         module_name = "test_module"
         logger = Logger(module_name, base_dir=tmpdir)
+        logger.base_dir.mkdir(parents=True)
 
         # Write invalid data to training file
         with open(logger.training_file, "w", encoding="utf-8") as f:
@@ -109,3 +121,78 @@ def test_timestamp_format():
             assert re.match(
                 r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z$", entry["timestamp"]
             )
+
+
+def test_utc_timestamp_matches_clock():
+    """Test that cached-second timestamps match the formatted clock time"""
+    with patch("time.time", side_effect=[1700000000.25, 1700000000.5, 1700000061.0]):
+        assert _utc_timestamp() == "2023-11-14T22:13:20.250000Z"
+        assert _utc_timestamp() == "2023-11-14T22:13:20.500000Z"
+        assert _utc_timestamp() == "2023-11-14T22:14:21.000000Z"
+
+
+def test_log_many_writes_all_records():
+    """Test log_many() appends one line per record"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = Logger("test_module", base_dir=tmpdir)
+        logger.log({"n": 0})
+        logger.log_many([{"n": 1}, {"n": 2}])
+        logger.log_many([])
+
+        with open(logger.logged_file, "r", encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f]
+        assert [entry["n"] for entry in entries] == [0, 1, 2]
+        assert all(entry["section"] == "logged" for entry in entries)
+
+
+def test_logger_close_and_reopen():
+    """Test that a closed logger reopens its file on the next write"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = Logger("test_module", base_dir=tmpdir)
+        logger.log({"n": 1})
+        logger.close()
+        logger.log({"n": 2})
+        logger.close()
+
+        with open(logger.logged_file, "r", encoding="utf-8") as f:
+            assert [json.loads(line)["n"] for line in f] == [1, 2]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_log_serializes_any_values(use_orjson):
+    """Test that records encode the same with or without orjson"""
+    orjson = pytest.importorskip("orjson") if use_orjson else None
+    with tempfile.TemporaryDirectory() as tmpdir, patch(
+        "simpledspy.logger.orjson", orjson
+    ):
+        logger = Logger("test_module", base_dir=tmpdir)
+        logger.log({"text": "Grüße", 1: "int key", "obj": Path("a/b")})
+
+        with open(logger.logged_file, "r", encoding="utf-8") as f:
+            entry = json.loads(f.readline())
+        assert entry["text"] == "Grüße"
+        assert entry["1"] == "int key"
+        assert entry["obj"] == "a/b"
+
+
+def test_load_training_data_skips_invalid_utf8():
+    """Test that a line with invalid UTF-8 is skipped like invalid JSON"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = Logger("test_module", base_dir=tmpdir)
+        logger.base_dir.mkdir(parents=True)
+        with open(logger.training_file, "wb") as f:
+            f.write(b'{"text": "\xff"}\n{"text": "ok"}\n')
+
+        assert logger.load_training_data() == [{"text": "ok"}]
+
+
+def test_logger_reopens_deleted_files():
+    """Test that records written after the log directory is deleted are kept"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = Logger("test_module", base_dir=tmpdir)
+        logger.log({"n": 1})
+        shutil.rmtree(logger.base_dir)
+        logger.log({"n": 2})
+
+        with open(logger.logged_file, "r", encoding="utf-8") as f:
+            assert [json.loads(line)["n"] for line in f] == [2]
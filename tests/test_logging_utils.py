@@ -0,0 +1,85 @@
+"""Tests for logging_utils.py"""
+
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from simpledspy.logging_utils import LoggingUtils, _get_logger
+from simpledspy.settings import settings as global_settings
+
+
+def _read_records(log_dir, module_name):
+    path = os.path.join(log_dir, "modules", module_name, "logged.jsonl")
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_log_results_writes_named_values():
+    """Test log_results() writes inputs and outputs with their names"""
+    with tempfile.TemporaryDirectory() as tmpdir, patch.object(
+        global_settings, "log_dir", tmpdir
+    ):
+        LoggingUtils.log_results(
+            "summary__predict__text", {"text": "long"}, ["text"], ["summary"], ["short"]
+        )
+
+        (record,) = _read_records(tmpdir, "summary__predict__text")
+        assert record["inputs"] == [{"name": "text", "value": "long"}]
+        assert record["outputs"] == [{"name": "summary", "value": "short"}]
+
+
+def test_log_results_buffered():
+    """Test that buffered records are written once the buffer is full"""
+    with tempfile.TemporaryDirectory() as tmpdir, patch.object(
+        global_settings, "log_dir", tmpdir
+    ), patch.object(global_settings, "log_buffer_size", 3):
+        for i in range(2):
+            LoggingUtils.log_results("m", {"x": i}, ["x"], ["y"], [i])
+        # Nothing is written (or even opened) until the buffer is full
+        assert not os.path.exists(os.path.join(tmpdir, "modules", "m"))
+
+        LoggingUtils.log_batch("m", [{"x": 2}], ["x"], ["y"], [[2]])
+        assert [r["outputs"][0]["value"] for r in _read_records(tmpdir, "m")] == [
+            0,
+            1,
+            2,
+        ]
+
+        LoggingUtils.log_results("m", {"x": 3}, ["x"], ["y"], [3])
+        LoggingUtils.flush()
+        assert len(_read_records(tmpdir, "m")) == 4
+
+
+@patch("simpledspy.logging_utils.Logger")
+def test_loggers_reused_per_module(mock_logger_class):
+    """Test that each module's Logger is created once and reused"""
+    _get_logger.cache_clear()
+    try:
+        for i in range(3):
+            LoggingUtils.log_results("m", {"x": i}, ["x"], ["y"], [i])
+        LoggingUtils.log_results("other", {"x": 0}, ["x"], ["y"], [0])
+
+        assert mock_logger_class.call_count == 2
+        assert mock_logger_class.return_value.log_many.call_count == 4
+    finally:
+        # Do not leave mock loggers cached for other tests
+        _get_logger.cache_clear()
+
+
+def test_relative_log_dir_follows_chdir(tmp_path, monkeypatch):
+    """Test that a relative log directory is resolved against the current one"""
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    with patch.object(global_settings, "log_dir", None):
+        monkeypatch.chdir(first)
+        LoggingUtils.log_results("m", {"x": 1}, ["x"], ["y"], [1])
+        monkeypatch.chdir(second)
+        LoggingUtils.log_results("m", {"x": 2}, ["x"], ["y"], [2])
+
+    assert len(_read_records(first / ".simpledspy", "m")) == 1
+    assert len(_read_records(second / ".simpledspy", "m")) == 1
@@ -57,6 +57,15 @@ class TestDictExactMatchMetric:
         prediction = ("hello", "earth")
         assert dict_exact_match_metric(example, prediction) == 0.5
 
+    def test_subclass_predictions(self):
+        """Test that dict and tuple subclasses are normalized like their bases"""
+        from collections import OrderedDict, namedtuple
+
+        Pair = namedtuple("Pair", ["first", "second"])
+        example = {"output_0": "hello", "output_1": "world"}
+        assert dict_exact_match_metric(example, Pair("hello", "world")) == 1.0
+        assert dict_exact_match_metric(example, OrderedDict(example)) == 1.0
+
     def test_non_dict_non_tuple_prediction(self):
         """Test when prediction is neither dict nor tuple"""
         example = {"output": "hello"}
@@ -98,3 +107,9 @@ class TestDictExactMatchMetric:
         example = {"only_key": "value1"}
         prediction = {"only_key": "value2"}
         assert dict_exact_match_metric(example, prediction) == 0.0
+
+    def test_long_tuple_prediction(self):
+        """Test tuple predictions beyond the precomputed output keys"""
+        values = tuple(range(40))
+        example = {f"output_{i}": i for i in range(40)}
+        assert dict_exact_match_metric(example, values) == 1.0
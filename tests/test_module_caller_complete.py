@@ -46,6 +46,13 @@ class TestBaseCaller:
         
         # All instances should be the same
         assert all(inst is instances[0] for inst in instances)
+
+    def test_existing_instance_skips_lock(self):
+        """Test that an existing singleton is returned without locking"""
+        caller = Predict()
+        with patch.object(BaseCaller, '_lock') as mock_lock:
+            assert Predict() is caller
+            mock_lock.__enter__.assert_not_called()
     
     @patch('simpledspy.module_caller.dspy')
     def test_lm_configuration(self, mock_dspy):
@@ -81,6 +88,24 @@ class TestBaseCaller:
                 # Should fallback to gpt-3.5-turbo
                 mock_dspy.LM.assert_called_with(model='openai/gpt-3.5-turbo')
     
+    @patch('simpledspy.module_caller.dspy')
+    def test_callers_copy_lm(self, mock_dspy):
+        """Test that callers for the same model get LM copies and configure once"""
+        with patch.object(settings, 'default_lm', None), patch.object(
+            settings, 'lm', None
+        ), patch.dict(BaseCaller._instances, clear=True):
+            mock_dspy.LM.side_effect = lambda **_: Mock()
+            mock_dspy.configure.side_effect = lambda lm, **_: setattr(
+                mock_dspy.settings, 'lm', lm
+            )
+
+            predict = Predict()
+            cot = ChainOfThought()
+
+            assert cot.lm is predict.lm.copy.return_value
+            mock_dspy.LM.assert_called_once_with(model='openai/gpt-3.5-turbo')
+            mock_dspy.configure.assert_called_once()
+
     def test_retry_config_initialization(self):
         """Test retry configuration initialization"""
         with patch.object(settings, 'retry_attempts', 5):
@@ -252,8 +277,10 @@ class TestBaseCaller:
                 lm_params=lm_params
             )
             
-            # Check that parameters were temporarily changed
+            # The call ran on a copy; the shared LM keeps its settings
             assert result == "result"
+            caller.lm.copy.assert_called_once_with(temperature=0.9, max_tokens=200)
+            assert caller.lm.temperature == 0.7
     
     def test_execute_and_log_logging_disabled(self):
         """Test that logging respects settings"""
@@ -278,6 +305,78 @@ class TestBaseCaller:
                 # Logging should not be called
                 mock_log.assert_not_called()
     
+    def test_batch(self):
+        """Test batch() runs one shared module and logs once"""
+        caller = Predict()
+        mock_module = Mock(
+            side_effect=lambda text, topic: Mock(summary=f"{text}/{topic}")
+        )
+        caller.lm = Mock(temperature=0.2)
+        seen_lms = []
+
+        def run_module(module, input_dict, lm_params, lm=None):
+            seen_lms.append(lm)
+            return module(**input_dict)
+
+        with patch.object(caller, '_create_module', return_value=mock_module) as mock_create, \
+                patch.object(caller, '_apply_training_data'), \
+                patch.object(caller, '_run_module', side_effect=run_module), \
+                patch.object(settings, 'logging_enabled', True), \
+                patch('simpledspy.module_caller.LoggingUtils.log_batch') as mock_log:
+            results = caller.batch(
+                [("a", "x"), ("b", "y"), ("c", "z")],
+                inputs=["text", "topic"],
+                outputs=["summary"],
+                lm_params={"temperature": 0.9},
+            )
+
+        assert results == ["a/x", "b/y", "c/z"]
+        mock_create.assert_called_once()
+        caller.lm.copy.assert_called_once_with(temperature=0.9)
+        assert seen_lms == [caller.lm.copy.return_value] * 3
+        assert caller.lm.temperature == 0.2
+        (name, input_dicts, *_), _ = mock_log.call_args
+        assert name == "summary__predict__text_topic"
+        assert input_dicts[1] == {"text": "b", "topic": "y"}
+
+    def test_override_lm_reuses_copies_and_validates(self):
+        """Test that lm_params copies are reused and unknown keys rejected"""
+        caller = Predict()
+        caller.lm = Mock(kwargs={"temperature": 0.2, "api_version": "v1"})
+        caller.lm.copy.side_effect = lambda **_: Mock()
+
+        first = caller._override_lm({"temperature": 0.9, "logging_enabled": False})
+        assert caller._override_lm({"temperature": 0.9}) is first
+        assert caller._override_lm({"temperature": 0.5}) is not first
+        assert caller._override_lm({"api_version": "v2"}) is not None
+        assert caller._override_lm({"logging_enabled": False}) is None
+        assert caller.lm.copy.call_count == 3
+
+        # Copies of a replaced LM are not reused
+        caller.lm = Mock(kwargs={})
+        assert caller._override_lm({"temperature": 0.9}) is caller.lm.copy.return_value
+
+        with pytest.raises(ValidationError, match="Unknown lm_params: tempreature"):
+            caller._override_lm({"tempreature": 0.9})
+
+    def test_batch_default_names_and_validation(self):
+        """Test batch() field defaults, empty batches and arity checks"""
+        caller = Predict()
+        mock_module = Mock(return_value=Mock(output="done"))
+
+        with patch.object(caller, '_create_module', return_value=mock_module) as mock_create, \
+                patch.object(caller, '_apply_training_data'), \
+                patch.object(settings, 'logging_enabled', False):
+            assert caller.batch(["one", "two"]) == ["done", "done"]
+            assert mock_create.call_args.kwargs["inputs"] == ["arg0"]
+            assert mock_create.call_args.kwargs["outputs"] == ["output"]
+            assert caller.batch([]) == []
+
+            with pytest.raises(ValidationError):
+                caller.batch([("a",), ("b", "c")])
+            with pytest.raises(ValidationError):
+                caller.batch([("a",)], outputs="output")
+
     def test_call_validation_errors(self):
         """Test validation in __call__ method"""
         caller = Predict()
@@ -429,7 +528,7 @@ class TestChainOfThought:
         cot = ChainOfThought()
         
         mock_signature = Mock()
-        with patch.object(cot.module_factory, 'create_signature', return_value=mock_signature):
+        with patch.object(cot.module_factory, 'get_signature', return_value=mock_signature):
             result = cot._create_module(
                 inputs=["question"],
                 outputs=["answer"],
@@ -438,8 +537,8 @@ class TestChainOfThought:
                 description="Q&A"
             )
             
-            # Should create signature
-            cot.module_factory.create_signature.assert_called_once_with(
+            # Should use the factory's cached signature
+            cot.module_factory.get_signature.assert_called_once_with(
                 inputs=["question"],
                 outputs=["answer"],
                 input_types={"question": str},
@@ -450,6 +549,16 @@ class TestChainOfThought:
             # Should create ChainOfThought with signature
             mock_cot_class.assert_called_once_with(mock_signature)
 
+    def test_chain_of_thought_reuses_signature(self):
+        """Test ChainOfThought modules share the cached signature class"""
+        cot = ChainOfThought()
+
+        module1 = cot._create_module(inputs=["question"], outputs=["answer"])
+        module2 = cot._create_module(inputs=["question"], outputs=["answer"])
+
+        assert module1 is not module2
+        assert module1.signature is module2.signature
+
 
 class TestEdgeCases:
     """Test edge cases and error conditions"""
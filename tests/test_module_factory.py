@@ -75,6 +75,20 @@ def test_create_module_with_description():
     assert description == module.signature.__doc__
 
 
+def test_create_module_with_indented_description():
+    """Test that indentation of multi-line descriptions is normalized"""
+    factory = ModuleFactory()
+    description = """
+        Summarize the text.
+        Keep it short.
+    """
+    module = factory.create_module(
+        inputs=["text"], outputs=["summary"], description=description
+    )
+
+    assert module.signature.__doc__ == "Summarize the text.\nKeep it short."
+
+
 def test_create_module_with_missing_types():
     """Test module creation with partial type hints"""
     factory = ModuleFactory()
@@ -236,3 +250,37 @@ def test_module_execution():
     # but we can check that it has the expected structure
     assert hasattr(module, "forward")
     assert callable(module.forward)
+
+
+def test_create_module_reuses_signature():
+    """Test that identical specifications share one signature class"""
+    factory = ModuleFactory()
+    module1 = factory.create_module(
+        inputs=["text"], outputs=["summary"], description="Summarize"
+    )
+    module2 = factory.create_module(
+        inputs=["text"], outputs=["summary"], description="Summarize"
+    )
+
+    # Modules hold per-call state like demos, so they must not be shared
+    assert module1 is not module2
+    assert module1.signature is module2.signature
+
+    module3 = factory.create_module(
+        inputs=["text"], outputs=["summary"], description="Translate"
+    )
+    assert module3.signature is not module1.signature
+
+
+def test_create_module_cache_respects_types():
+    """Test that differing type hints produce distinct signatures"""
+    factory = ModuleFactory()
+    module1 = factory.create_module(
+        inputs=["value"], outputs=["result"], input_types={"value": int}
+    )
+    module2 = factory.create_module(
+        inputs=["value"], outputs=["result"], input_types={"value": float}
+    )
+
+    assert module1.signature is not module2.signature
+    assert module2.signature.model_fields["value"].annotation == float
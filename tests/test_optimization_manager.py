@@ -77,6 +77,17 @@ def test_get_teleprompter() -> None:
     assert isinstance(teleprompter, MIPROv2)
 
 
+def test_get_teleprompter_num_threads() -> None:
+    """Test that num_threads is forwarded to parallel teleprompters"""
+    manager = OptimizationManager()
+
+    manager.configure(strategy="mipro", num_threads=4)
+    assert manager.get_teleprompter().num_threads == 4
+
+    manager.configure(strategy="bootstrap_random")
+    assert manager.get_teleprompter().num_threads == 4
+
+
 def test_dict_exact_match_metric_empty() -> None:
     """Test the dict_exact_match_metric function with empty inputs"""
     # Test with empty example and prediction
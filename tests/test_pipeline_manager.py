@@ -2,6 +2,7 @@
 
 import os
 import sys
+import threading
 import dspy
 import pytest
 
@@ -95,6 +96,20 @@ def test_missing_input():
         _ = pipeline()  # Missing input (unused variable)
 
 
+def test_missing_input_names_field():
+    """Test that the missing input of a multi-input step is reported"""
+    manager = PipelineManager()
+    manager.reset()
+
+    module = MockModule("test output")
+    manager.register_step(inputs=["a", "b"], outputs=["output1"], module=module)
+
+    pipeline = manager.assemble_pipeline()
+
+    with pytest.raises(ValueError, match="Step 0: Missing input 'b'"):
+        _ = pipeline(a="only a")
+
+
 def test_missing_output():
     """Test missing output in pipeline execution"""
     manager = PipelineManager()
@@ -114,3 +129,87 @@ def test_missing_output():
 
     with pytest.raises(ValueError):
         _ = pipeline(input1="test input")  # unused variable
+
+
+def test_missing_prediction_field():
+    """Test that a field missing from a Prediction is reported by name"""
+    manager = PipelineManager()
+    manager.reset()
+
+    module = MockModule(output1="present")
+    manager.register_step(
+        inputs=["input1"], outputs=["output1", "output2"], module=module
+    )
+
+    pipeline = manager.assemble_pipeline()
+
+    with pytest.raises(ValueError, match="Output field 'output2' not found"):
+        _ = pipeline(input1="test input")
+
+
+def test_independent_steps_share_level():
+    """Test that steps without data dependencies are grouped together"""
+    manager = PipelineManager()
+    manager.reset()
+
+    manager.register_step(inputs=["text"], outputs=["a"], module=MockModule(a="A"))
+    manager.register_step(inputs=["text"], outputs=["b"], module=MockModule(b="B"))
+    manager.register_step(inputs=["a", "b"], outputs=["c"], module=MockModule(c="C"))
+    # Overwrites an input of step 0, so it has to run after it
+    manager.register_step(inputs=["c"], outputs=["text"], module=MockModule(text="T"))
+
+    pipeline = manager.assemble_pipeline()
+    assert pipeline.levels == [[0, 1], [2], [3]]
+
+    result = pipeline(text="input")
+    assert result.a == "A"
+    assert result.b == "B"
+    assert result.c == "C"
+    assert result.text == "T"
+
+
+def test_independent_steps_run_concurrently():
+    """Test that steps in the same level are executed concurrently"""
+    manager = PipelineManager()
+    manager.reset()
+
+    # Each module waits for the other one, which only succeeds when they
+    # run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    class WaitingModule(MockModule):
+        """Module that waits on the shared barrier"""
+
+        def forward(self, **kwargs):
+            barrier.wait()
+            return super().forward(**kwargs)
+
+    manager.register_step(inputs=["text"], outputs=["a"], module=WaitingModule(a="A"))
+    manager.register_step(inputs=["text"], outputs=["b"], module=WaitingModule(b="B"))
+
+    result = manager.assemble_pipeline()(text="input")
+    assert result.a == "A"
+    assert result.b == "B"
+
+
+def test_steps_are_thread_local():
+    """Test that steps registered in one thread are not visible in another"""
+    manager = PipelineManager()
+    manager.reset()
+    manager.register_step(inputs=["input1"], outputs=["output1"], module=MockModule())
+
+    seen = []
+
+    def worker():
+        seen.append(len(PipelineManager()._steps))  # pylint: disable=protected-access
+        PipelineManager().register_step(
+            inputs=["x"], outputs=["y"], module=MockModule()
+        )
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen == [0]
+    # pylint: disable=protected-access
+    assert len(manager._steps) == 1
@@ -323,7 +323,7 @@ def test_complex_type_hints(mock_logger_class):
 
 
 def test_lm_param_override_and_restore():
-    """Test that lm_params temporarily override LM settings"""
+    """Test that lm_params apply to a copy of the LM, not the shared one"""
     # Reset instances so we get a fresh caller with patched LM
     from simpledspy.module_caller import BaseCaller, Predict
 
@@ -336,7 +336,7 @@ def test_lm_param_override_and_restore():
 
         class MockModule(dspy.Module):
             def forward(self, **_):
-                captured["temp"] = mock_lm.temperature
+                captured["lm"] = dspy.settings.lm
                 return dspy.Prediction(result="ok")
 
         with patch(
@@ -350,7 +350,8 @@ def test_lm_param_override_and_restore():
                 lm_params={"temperature": 0.9},
             )
             assert result == "ok"
-            assert captured["temp"] == 0.9
+            mock_lm.copy.assert_called_once_with(temperature=0.9)
+            assert captured["lm"] is mock_lm.copy.return_value
             assert caller.lm.temperature == 0.2
 
 
@@ -402,3 +403,40 @@ def test_predict_loads_training_data_with_default_name(monkeypatch):
 
         # Check result
         assert result == "test output"
+
+
+def test_predict_infers_names_from_call_site(monkeypatch):
+    """Test that input and output names come from the calling line"""
+    monkeypatch.setattr(global_settings, "logging_enabled", False)
+    with (
+        patch("simpledspy.module_caller.BaseCaller._create_module") as mock_create,
+        patch("simpledspy.module_caller.BaseCaller._run_module") as mock_run,
+        patch("simpledspy.module_caller.BaseCaller._apply_training_data"),
+    ):
+        mock_run.return_value = MagicMock(summary="short", topic="news")
+
+        article = "long text"
+        summary, topic = predict(article)
+
+        assert (summary, topic) == ("short", "news")
+        assert mock_create.call_args.kwargs["inputs"] == ["article"]
+        assert mock_create.call_args.kwargs["outputs"] == ["summary", "topic"]
+
+
+def test_predict_without_introspection(monkeypatch):
+    """Test that disabled introspection falls back to default names"""
+    monkeypatch.setattr(global_settings, "logging_enabled", False)
+    monkeypatch.setattr(global_settings, "introspection_enabled", False)
+    with (
+        patch("simpledspy.module_caller.BaseCaller._create_module") as mock_create,
+        patch("simpledspy.module_caller.BaseCaller._run_module") as mock_run,
+        patch("simpledspy.module_caller.BaseCaller._apply_training_data"),
+    ):
+        mock_run.return_value = MagicMock(output="short")
+
+        article = "long text"
+        summary = predict(article)
+
+        assert summary == "short"
+        assert mock_create.call_args.kwargs["inputs"] == ["arg0"]
+        assert mock_create.call_args.kwargs["outputs"] == ["output"]
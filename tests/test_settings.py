@@ -17,6 +17,10 @@ class TestSettings:
         assert s.log_dir == ".simpledspy"
         assert s.default_lm is None
         assert s.evaluator_lm is None
+        assert s.api_base is None
+        assert s.cache is True
+        assert s.introspection_enabled is True
+        assert s.log_buffer_size == 1
 
     def test_settings_str_representation(self):
         """Test string representation of Settings"""
@@ -63,6 +67,23 @@ class TestSettings:
         assert s.default_lm == "default-model"
         assert s.evaluator_lm == "eval-model"
 
+    def test_lm_kwargs_default(self):
+        """Test that no extra LM kwargs are produced by default"""
+        s = Settings()
+        assert s.lm_kwargs() == {}
+
+    def test_lm_kwargs_with_api_base(self):
+        """Test that api_base is forwarded to LM construction"""
+        s = Settings()
+        s.api_base = "http://localhost:8000/v1"
+        assert s.lm_kwargs() == {"api_base": "http://localhost:8000/v1"}
+
+    def test_lm_kwargs_with_cache_disabled(self):
+        """Test that disabling the cache is forwarded to LM construction"""
+        s = Settings()
+        s.cache = False
+        assert s.lm_kwargs() == {"cache": False}
+
     def test_settings_independent_instances(self):
         """Test that multiple Settings instances are independent"""
         s1 = Settings()
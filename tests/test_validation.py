@@ -212,11 +212,11 @@ class TestSecurityValidation:
         mock_frame.f_back.f_back.f_back.f_globals = {}
         
         with patch('inspect.currentframe', return_value=mock_frame):
-            with patch('inspect.getframeinfo') as mock_info:
-                mock_info.return_value.code_context = [nested_code]
+            with patch('linecache.getline') as mock_info:
+                mock_info.return_value = nested_code
                 
                 # The deeply nested AST should raise SecurityError
                 with pytest.raises(SecurityError) as exc_info:
-                    predict._infer_input_names(("test",))
+                    predict._infer_input_names(("test",), mock_frame)
                 
                 assert "AST too deep" in str(exc_info.value)
\ No newline at end of file